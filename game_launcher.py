@@ -5,15 +5,37 @@ A multi-game selection system for the arcade cabinet
 """
 
 import pygame
+import pygame.freetype
 import sys
 import os
 import subprocess
-import json
+import marshal
 import time
 from pathlib import Path
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
-# Initialize Pygame
-pygame.init()
+# SDL render batching coalesces draws into fewer GPU submissions. It can add
+# a little input latency, so it can be turned off with --no-render-batching.
+if '--no-render-batching' not in sys.argv:
+    os.environ.setdefault("SDL_RENDER_BATCHING", "1")
+
+# Initialize only the pygame subsystems the launcher uses (no audio mixer)
+pygame.display.init()
+pygame.freetype.init()
+pygame.joystick.init()
+
+# Events after which the window contents may be lost (uncovered, restored,
+# or focused again when a launched game's window closes)
+REPAINT_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED,
+                  pygame.WINDOWFOCUSGAINED)
 
 # Colors
 BLACK = (0, 0, 0)
@@ -25,27 +47,45 @@ RED = (255, 0, 0)
 GRAY = (128, 128, 128)
 DARK_GRAY = (64, 64, 64)
 
+# pygame.font shrinks its default font to 68.75%; freetype doesn't, so apply
+# the same factor to keep the launcher's text sizes unchanged
+DEFAULT_FONT_SCALE = 0.6875
+
 class GameLauncher:
+    __slots__ = (
+        'screen', 'width', 'height',
+        'font_huge', 'font_large', 'font_medium', 'font_small',
+        'selected_game', 'running', 'games', 'joystick', '_btn_map',
+        '_dirty', '_dirty_rects', '_config_cache',
+        '_bg', '_icons', '_title_surf', '_title_pos', '_controls_surf', '_controls_pos',
+        '_row_surfs_sel', '_row_surfs_unsel', '_row_rects', '_row_blits',
+    )
+    
     def __init__(self):
         # Screen setup
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        self.width, self.height = self.screen.get_size()
-        pygame.display.set_caption("Arcade Game Launcher")
+        self.setup_display()
         
         # Fonts
-        self.font_huge = pygame.font.Font(None, int(self.height * 0.08))
-        self.font_large = pygame.font.Font(None, int(self.height * 0.06))
-        self.font_medium = pygame.font.Font(None, int(self.height * 0.04))
-        self.font_small = pygame.font.Font(None, int(self.height * 0.03))
+        self.font_huge = pygame.freetype.Font(None, int(self.height * 0.08) * DEFAULT_FONT_SCALE)
+        self.font_large = pygame.freetype.Font(None, int(self.height * 0.06) * DEFAULT_FONT_SCALE)
+        self.font_medium = pygame.freetype.Font(None, int(self.height * 0.04) * DEFAULT_FONT_SCALE)
+        self.font_small = pygame.freetype.Font(None, int(self.height * 0.03) * DEFAULT_FONT_SCALE)
         
         # Game state
         self.selected_game = 0
         self.running = True
-        self.clock = pygame.time.Clock()
+        
+        # Redraw tracking - the menu only changes on button presses
+        self._dirty = True
+        self._dirty_rects = []
         
         # Load games configuration
+        self._config_cache = None
         self.games = self.load_games()
         
+        # Pre-render static UI (title, game rows, controls)
+        self._build_cached_surfaces()
+        
         # Joystick setup
         self.setup_joystick()
         
@@ -53,50 +93,60 @@ class GameLauncher:
         print(f"📺 Screen resolution: {self.width}x{self.height}")
         print(f"🎯 Found {len(self.games)} games")
         
+    def setup_display(self):
+        """Open the fullscreen launcher window"""
+        # Ask for a double-buffered hardware surface with vsync; not every
+        # video driver supports vsync, so fall back to plain double buffering
+        flags = pygame.FULLSCREEN | pygame.DOUBLEBUF | pygame.HWSURFACE
+        try:
+            self.screen = pygame.display.set_mode((0, 0), flags, vsync=1)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((0, 0), flags)
+        self.width, self.height = self.screen.get_size()
+        pygame.display.set_caption("Arcade Game Launcher")
+        
     def load_games(self):
         """Load available games from configuration file"""
         config_file = "games.json"
         games = []
         
         try:
-            if os.path.exists(config_file):
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+            config = self.read_config(config_file)
+            
+            # Load enabled games
+            for game in config.get("games", []):
+                if game.get("enabled", True):
+                    games.append(game)
                     
-                # Load enabled games
-                for game in config.get("games", []):
-                    if game.get("enabled", True):
-                        games.append(game)
-                        
-                # Add coming soon placeholder if enabled
-                if config.get("settings", {}).get("show_coming_soon", True):
-                    games.append({
-                        "name": "Coming Soon",
-                        "description": "More games will be added here",
-                        "script": None,
-                        "icon": "🎮",
-                        "working_dir": None
-                    })
-                        
-            else:
-                # Fallback to hardcoded games if no config file
-                games = [
-                    {
-                        "name": "Astrid Mart",
-                        "description": "Shopping adventure with barcode scanner",
-                        "script": "main.py",
-                        "icon": "🛒",
-                        "working_dir": "/home/astrid/astridmart"
-                    },
-                    {
-                        "name": "Coming Soon",
-                        "description": "More games will be added here",
-                        "script": None,
-                        "icon": "🎮",
-                        "working_dir": None
-                    }
-                ]
+            # Add coming soon placeholder if enabled
+            if config.get("settings", {}).get("show_coming_soon", True):
+                games.append({
+                    "name": "Coming Soon",
+                    "description": "More games will be added here",
+                    "script": None,
+                    "icon": "🎮",
+                    "working_dir": None
+                })
                 
+        except FileNotFoundError:
+            # Fallback to hardcoded games if no config file
+            games = [
+                {
+                    "name": "Astrid Mart",
+                    "description": "Shopping adventure with barcode scanner",
+                    "script": "main.py",
+                    "icon": "🛒",
+                    "working_dir": "/home/astrid/astridmart"
+                },
+                {
+                    "name": "Coming Soon",
+                    "description": "More games will be added here",
+                    "script": None,
+                    "icon": "🎮",
+                    "working_dir": None
+                }
+            ]
+            
         except Exception as e:
             print(f"⚠️  Error loading games config: {e}")
             # Fallback to basic configuration
@@ -110,11 +160,40 @@ class GameLauncher:
             
         return games
         
+    def read_config(self, config_file):
+        """Parse the games config, reusing the last result if the file is unchanged"""
+        path = Path(config_file)
+        mtime = path.stat().st_mtime_ns
+        if self._config_cache and self._config_cache[0] == mtime:
+            return self._config_cache[1]
+            
+        # Precompiled cache next to the config skips JSON parsing on startup
+        cache_path = path.with_suffix(".cache")
+        config = self.read_compiled_config(cache_path, mtime)
+        if config is None:
+            config = json_loads(path.read_bytes())
+            try:
+                cache_path.write_bytes(marshal.dumps((mtime, config)))
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not write games cache: {e}")
+                
+        self._config_cache = (mtime, config)
+        return config
+        
+    def read_compiled_config(self, cache_path, mtime):
+        """Return the marshalled config if it was built from this mtime, else None"""
+        try:
+            cached_mtime, config = marshal.loads(cache_path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        return config if cached_mtime == mtime else None
+        
     def setup_joystick(self):
         """Setup joystick/arcade controller"""
         pygame.joystick.init()
         self.joystick = None
-        self.joystick_button_mapping = {0: 'green', 1: 'blue', 2: 'yellow', 3: 'red'}
+        # Button colors indexed by joystick button number
+        self._btn_map = ('green', 'blue', 'yellow', 'red')
         
         if pygame.joystick.get_count() > 0:
             self.joystick = pygame.joystick.Joystick(0)
@@ -128,12 +207,23 @@ class GameLauncher:
         if button_color == 'green':  # K1 - Select/Launch game
             self.launch_selected_game()
         elif button_color == 'blue':  # K2 - Previous game
-            self.selected_game = (self.selected_game - 1) % len(self.games)
+            self.select_game((self.selected_game - 1) % len(self.games))
         elif button_color == 'yellow':  # K3 - Next game
-            self.selected_game = (self.selected_game + 1) % len(self.games)
+            self.select_game((self.selected_game + 1) % len(self.games))
         elif button_color == 'red':  # K4 - Shutdown system
             self.shutdown_system()
             
+    def select_game(self, index):
+        """Move the selection and mark the two affected rows for redraw"""
+        old = self.selected_game
+        self.selected_game = index
+        self._dirty_rects.append(self._row_rects[old])
+        self._dirty_rects.append(self._row_rects[index])
+        
+        # Swap just the two changed entries in the prepared blit sequence
+        self._row_blits[old] = (self._row_surfs_unsel[old], self._row_rects[old])
+        self._row_blits[index] = (self._row_surfs_sel[index], self._row_rects[index])
+            
     def launch_selected_game(self):
         """Launch the currently selected game"""
         game = self.games[self.selected_game]
@@ -144,24 +234,33 @@ class GameLauncher:
             
         print(f"🚀 Launching game: {game['name']}")
         
+        # Release the window so the game gets it to itself
+        pygame.display.quit()
+        
         try:
-            # Change to game directory and run the script
-            old_cwd = os.getcwd()
-            if game["working_dir"] and os.path.exists(game["working_dir"]):
-                os.chdir(game["working_dir"])
-                
-            # Run the game and wait for it to complete
-            result = subprocess.run([sys.executable, game["script"]], 
-                                  capture_output=False, text=True)
-            
-            # Return to original directory
-            os.chdir(old_cwd)
-            
+            # Run the game in its own directory and wait for it to complete
+            command = [sys.executable, game["script"]]
+            try:
+                result = subprocess.run(command, cwd=game["working_dir"] or None)
+            except FileNotFoundError:
+                # Working directory missing - run from ours instead
+                result = subprocess.run(command)
             print(f"🎮 Game '{game['name']}' exited with code: {result.returncode}")
             
         except Exception as e:
             print(f"❌ Error launching game '{game['name']}': {e}")
             
+        finally:
+            # Pick up config changes made while the game was running
+            self.games = self.load_games()
+            self.selected_game = min(self.selected_game, len(self.games) - 1)
+            
+            # Take the screen back and rebuild surfaces for the new display
+            pygame.display.init()
+            self.setup_display()
+            self._build_cached_surfaces()
+            self._dirty = True
+            
     def shutdown_system(self):
         """Safely shutdown the system"""
         print("🔌 Shutting down system...")
@@ -176,92 +275,171 @@ class GameLauncher:
         
     def draw_background(self):
         """Draw the launcher background"""
-        # Gradient background
-        for y in range(self.height):
-            color_intensity = int(20 + (y / self.height) * 30)
-            color = (color_intensity, color_intensity, color_intensity)
-            pygame.draw.line(self.screen, color, (0, y), (self.width, y))
+        self.screen.blit(self._bg, (0, 0))
             
-    def draw_title(self):
-        """Draw the main title"""
-        title = self.font_huge.render("🎮 ARCADE GAMES", True, BRIGHT_GREEN)
-        title_rect = title.get_rect(center=(self.width//2, self.height * 0.15))
-        
-        # Title background
-        bg_rect = pygame.Rect(title_rect.x - 20, title_rect.y - 10, 
-                             title_rect.width + 40, title_rect.height + 20)
-        pygame.draw.rect(self.screen, DARK_GRAY, bg_rect)
-        pygame.draw.rect(self.screen, BRIGHT_GREEN, bg_rect, 3)
+    def _build_cached_surfaces(self):
+        """Pre-render the background, title, game rows and controls so draw() only blits"""
+        # Gradient background
+        self._bg = pygame.Surface((self.width, self.height)).convert()
+        self._render_gradient(self._bg)
         
-        self.screen.blit(title, title_rect)
+        # Title with its background box
+        title = self._render_text(self.font_huge, "ARCADE GAMES", BRIGHT_GREEN)
+        title_rect = title.get_rect(center=(self.width//2, self.height * 0.15))
+        self._title_surf = pygame.Surface((title_rect.width + 40, title_rect.height + 20)).convert()
+        self._title_surf.fill(DARK_GRAY)
+        pygame.draw.rect(self._title_surf, BRIGHT_GREEN, self._title_surf.get_rect(), 3)
+        self._title_surf.blit(title, (20, 10))
+        self._title_pos = (title_rect.x - 20, title_rect.y - 10)
         
-    def draw_games(self):
-        """Draw the list of available games"""
-        start_y = self.height * 0.35
-        game_height = self.height * 0.12
+        # Game rows - one selected and one unselected variant per game
+        self._row_surfs_sel = []
+        self._row_surfs_unsel = []
+        row_size = (int(self.width * 0.8), int(self.height * 0.12 * 0.8))
+        icon_size = int(row_size[1] * 0.7)
+        self._icons = {game["name"]: self._load_icon(game, icon_size) for game in self.games}
+        for game in self.games:
+            self._row_surfs_sel.append(self._render_game_row(game, row_size, True))
+            self._row_surfs_unsel.append(self._render_game_row(game, row_size, False))
+        self._layout_rows()
         
-        for i, game in enumerate(self.games):
-            y = start_y + (i * game_height)
-            
-            # Game selection box
-            game_rect = pygame.Rect(self.width * 0.1, y, self.width * 0.8, game_height * 0.8)
-            
-            # Highlight selected game
-            if i == self.selected_game:
-                pygame.draw.rect(self.screen, BRIGHT_GREEN, game_rect)
-                pygame.draw.rect(self.screen, WHITE, game_rect, 4)
-                text_color = BLACK
-            else:
-                pygame.draw.rect(self.screen, DARK_GRAY, game_rect)
-                pygame.draw.rect(self.screen, GRAY, game_rect, 2)
-                text_color = WHITE
-                
-            # Game icon
-            icon_text = self.font_large.render(game["icon"], True, text_color)
-            icon_rect = icon_text.get_rect(center=(game_rect.x + 60, game_rect.centery))
-            self.screen.blit(icon_text, icon_rect)
-            
-            # Game name
-            name_text = self.font_large.render(game["name"], True, text_color)
-            name_rect = name_text.get_rect(midleft=(game_rect.x + 120, game_rect.centery - 15))
-            self.screen.blit(name_text, name_rect)
-            
-            # Game description
-            desc_text = self.font_small.render(game["description"], True, text_color)
-            desc_rect = desc_text.get_rect(midleft=(game_rect.x + 120, game_rect.centery + 15))
-            self.screen.blit(desc_text, desc_rect)
-            
-            # Availability indicator
-            if game["script"] is None:
-                status_text = self.font_small.render("Coming Soon", True, YELLOW)
-                status_rect = status_text.get_rect(midright=(game_rect.right - 20, game_rect.centery))
-                self.screen.blit(status_text, status_rect)
-                
-    def draw_controls(self):
-        """Draw control instructions"""
+        # Controls strip - transparent so the gradient shows through
         controls_y = self.height * 0.85
-        
         controls = [
-            ("🟢 SELECT", "Launch Game"),
-            ("🔵 PREV", "Previous Game"),
-            ("🟡 NEXT", "Next Game"),
-            ("🔴 POWER", "Shutdown System")
+            ("SELECT", "Launch Game", BRIGHT_GREEN),
+            ("PREV", "Previous Game", BLUE),
+            ("NEXT", "Next Game", YELLOW),
+            ("POWER", "Shutdown System", RED)
         ]
-        
         control_width = self.width // len(controls)
+        strip_top = int(controls_y) - self.font_small.get_sized_height()
+        strip = pygame.Surface((self.width, self.height - strip_top), pygame.SRCALPHA)
+        dot_radius = self.font_small.get_sized_height() // 3
         
-        for i, (button, action) in enumerate(controls):
+        for i, (button, action, color) in enumerate(controls):
             x = i * control_width + control_width // 2
             
-            # Button indicator
-            button_text = self.font_small.render(button, True, WHITE)
-            button_rect = button_text.get_rect(center=(x, controls_y))
-            self.screen.blit(button_text, button_rect)
+            # Button indicator - a colored dot drawn before the label
+            button_text = self._render_text(self.font_small, button, WHITE)
+            button_rect = button_text.get_rect(center=(x + dot_radius + 2, controls_y - strip_top))
+            pygame.draw.circle(strip, color, (button_rect.x - dot_radius - 4, button_rect.centery), dot_radius)
+            strip.blit(button_text, button_rect)
             
             # Action text
-            action_text = self.font_small.render(action, True, GRAY)
-            action_rect = action_text.get_rect(center=(x, controls_y + 25))
-            self.screen.blit(action_text, action_rect)
+            action_text = self._render_text(self.font_small, action, GRAY)
+            strip.blit(action_text, action_text.get_rect(center=(x, controls_y + 25 - strip_top)))
+        
+        self._controls_surf = strip.convert_alpha()
+        self._controls_pos = (0, strip_top)
+        
+    def _load_icon(self, game, size):
+        """Load the game's optional icon_image scaled to fit a size x size box"""
+        path = game.get("icon_image")
+        if not path:
+            return None
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"⚠️  Could not load icon for '{game['name']}': {e}")
+            return None
+        scale = size / max(image.get_size())
+        icon_size = (int(image.get_width() * scale), int(image.get_height() * scale))
+        return pygame.transform.smoothscale(image.convert_alpha(), icon_size)
+        
+    def _render_gradient(self, surface):
+        """Fill surface with the vertical gray gradient"""
+        # The gradient only varies by row, so render a single 1 x height column
+        # and let SDL stretch it across the width
+        height = surface.get_height()
+        strip = pygame.Surface((1, height), 0, surface)
+        if NUMPY_AVAILABLE:
+            column = (20 + (np.arange(height) / height) * 30).astype(np.uint8)
+            pixels = pygame.surfarray.pixels3d(strip)
+            pixels[0] = column[:, None]
+            del pixels  # Unlock the strip
+        else:
+            strip.lock()
+            try:
+                for y in range(height):
+                    color_intensity = int(20 + (y / height) * 30)
+                    strip.set_at((0, y), (color_intensity, color_intensity, color_intensity))
+            finally:
+                strip.unlock()
+        pygame.transform.scale(strip, surface.get_size(), surface)
+                
+    def _render_text(self, font, text, color):
+        """Render text already converted to the display pixel format"""
+        surface, _ = font.render(text, color)
+        return surface.convert_alpha()
+        
+    def _render_game_row(self, game, size, selected):
+        """Render a single game row (box, icon, name, description, status)"""
+        surf = pygame.Surface(size).convert()
+        rect = surf.get_rect()
+        
+        # Highlight selected game
+        if selected:
+            surf.fill(BRIGHT_GREEN)
+            pygame.draw.rect(surf, WHITE, rect, 4)
+            text_color = BLACK
+        else:
+            surf.fill(DARK_GRAY)
+            pygame.draw.rect(surf, GRAY, rect, 2)
+            text_color = WHITE
+            
+        # Game icon - the default font has no emoji glyphs, so games without
+        # an icon_image get a letter badge instead
+        icon = self._icons.get(game["name"])
+        if icon:
+            surf.blit(icon, icon.get_rect(center=(60, rect.centery)))
+        else:
+            radius = int(rect.height * 0.35)
+            pygame.draw.circle(surf, text_color, (60, rect.centery), radius, 3)
+            letter = self._render_text(self.font_large, game["name"][:1], text_color)
+            surf.blit(letter, letter.get_rect(center=(60, rect.centery)))
+        
+        # Game name
+        name_text = self._render_text(self.font_large, game["name"], text_color)
+        surf.blit(name_text, name_text.get_rect(midleft=(120, rect.centery - 15)))
+        
+        # Game description
+        desc_text = self._render_text(self.font_small, game["description"], text_color)
+        surf.blit(desc_text, desc_text.get_rect(midleft=(120, rect.centery + 15)))
+        
+        # Availability indicator
+        if game["script"] is None:
+            status_text = self._render_text(self.font_small, "Coming Soon", YELLOW)
+            surf.blit(status_text, status_text.get_rect(midright=(rect.right - 20, rect.centery)))
+            
+        return surf
+        
+    def draw_title(self):
+        """Draw the main title"""
+        self.screen.blit(self._title_surf, self._title_pos)
+        
+    def _layout_rows(self):
+        """Precompute the screen rect and blit sequence of every game row"""
+        x = int(self.width * 0.1)
+        start_y = self.height * 0.35
+        game_height = self.height * 0.12
+        self._row_rects = [
+            surf.get_rect(topleft=(x, int(start_y + i * game_height)))
+            for i, surf in enumerate(self._row_surfs_unsel)
+        ]
+        self._row_blits = [
+            (self._row_surfs_sel[i] if i == self.selected_game else surf, rect)
+            for i, (surf, rect) in enumerate(zip(self._row_surfs_unsel, self._row_rects))
+        ]
+        
+    def draw_games(self):
+        """Draw the list of available games"""
+        # The blit sequence is kept up to date by select_game, so a frame is
+        # one C-level call with no per-row Python work
+        self.screen.blits(self._row_blits, doreturn=0)
+                
+    def draw_controls(self):
+        """Draw control instructions"""
+        self.screen.blit(self._controls_surf, self._controls_pos)
             
     def draw(self):
         """Main drawing function"""
@@ -272,44 +450,58 @@ class GameLauncher:
         
         pygame.display.flip()
         
-    def handle_events(self):
-        """Handle pygame events"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+    def handle_event(self, event):
+        """Handle a single pygame event"""
+        if event.type == pygame.QUIT:
+            self.running = False
+            
+        elif event.type in REPAINT_EVENTS:
+            self._dirty = True
+            
+        elif event.type == pygame.KEYDOWN:
+            # Keyboard controls for development
+            if event.key == pygame.K_ESCAPE:
                 self.running = False
+            elif event.key == pygame.K_x:  # Green button
+                self.handle_button_press('green')
+            elif event.key == pygame.K_p:  # Blue button
+                self.handle_button_press('blue')
+            elif event.key == pygame.K_c:  # Yellow button
+                self.handle_button_press('yellow')
+            elif event.key == pygame.K_q:  # Red button
+                self.handle_button_press('red')
+            elif event.key == pygame.K_UP:
+                self.handle_button_press('blue')
+            elif event.key == pygame.K_DOWN:
+                self.handle_button_press('yellow')
+            elif event.key == pygame.K_RETURN:
+                self.handle_button_press('green')
+                
+        elif event.type == pygame.JOYBUTTONDOWN and self.joystick:
+            # Joystick button press
+            button_color = self._btn_map[event.button] if event.button < len(self._btn_map) else None
+            if button_color:
+                print(f"🕹️  Joystick button {event.button} pressed ({button_color})")
+                self.handle_button_press(button_color)
                 
-            elif event.type == pygame.KEYDOWN:
-                # Keyboard controls for development
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
-                elif event.key == pygame.K_x:  # Green button
-                    self.handle_button_press('green')
-                elif event.key == pygame.K_p:  # Blue button
-                    self.handle_button_press('blue')
-                elif event.key == pygame.K_c:  # Yellow button
-                    self.handle_button_press('yellow')
-                elif event.key == pygame.K_q:  # Red button
-                    self.handle_button_press('red')
-                elif event.key == pygame.K_UP:
-                    self.handle_button_press('blue')
-                elif event.key == pygame.K_DOWN:
-                    self.handle_button_press('yellow')
-                elif event.key == pygame.K_RETURN:
-                    self.handle_button_press('green')
-                    
-            elif event.type == pygame.JOYBUTTONDOWN and self.joystick:
-                # Joystick button press
-                button_color = self.joystick_button_mapping.get(event.button)
-                if button_color:
-                    print(f"🕹️  Joystick button {event.button} pressed ({button_color})")
-                    self.handle_button_press(button_color)
-                    
     def run(self):
         """Main game loop"""
         while self.running:
-            self.handle_events()
-            self.draw()
-            self.clock.tick(60)
+            if self._dirty:
+                # Full repaint (startup, returning from a game)
+                self.draw()
+                self._dirty = False
+                self._dirty_rects = []
+            elif self._dirty_rects:
+                # Selection changed - only the old and new rows need updating
+                self.draw_games()
+                pygame.display.update(self._dirty_rects)
+                self._dirty_rects = []
+                
+            # Nothing animates, so sleep until input arrives, then drain the queue
+            self.handle_event(pygame.event.wait())
+            for event in pygame.event.get():
+                self.handle_event(event)
             
         pygame.quit()
         sys.exit()
@@ -3,9 +3,29 @@ import json
 import random
 import time
 import os
+import sys
 import csv
+import marshal
 import threading
-import queue
+import logging
+import subprocess
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from types import SimpleNamespace
+try:
+    from orjson import loads as json_loads
+    from orjson import dumps as orjson_dumps, OPT_INDENT_2
+    
+    def json_dumps(data):
+        """Serialize data as indented JSON bytes"""
+        return orjson_dumps(data, option=OPT_INDENT_2)
+except ImportError:
+    from json import loads as json_loads
+    
+    def json_dumps(data):
+        """Serialize data as indented JSON bytes"""
+        return json.dumps(data, indent=2).encode('utf-8')
 try:
     import serial
     import serial.tools.list_ports
@@ -14,6 +34,9 @@ except ImportError:
     SERIAL_AVAILABLE = False
     print("pyserial not available - serial barcode scanners won't work")
 
+# Debug output goes through logging so messages are only formatted when enabled
+log = logging.getLogger("astridmart")
+
 # Initialize Pygame
 pygame.init()
 
@@ -22,6 +45,21 @@ display_info = pygame.display.Info()
 SCREEN_WIDTH = display_info.current_w
 SCREEN_HEIGHT = display_info.current_h
 FPS = 60
+TEXT_CACHE_SIZE = 512  # Max rendered text surfaces kept in memory
+IMAGE_LOAD_WORKERS = 8  # Threads used to decode product images
+CSV_BUFFER_SIZE = 1 << 20  # File buffer for CSV import/export, fewer read/write calls on big catalogs
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")  # pygame-ce's faster batched blit
+
+# The only event types handle_events acts on (VIDEOEXPOSE just forces a redraw)
+HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.JOYBUTTONDOWN, pygame.VIDEOEXPOSE)
+
+# Shutdown methods tried in order by the shutdown combo
+SHUTDOWN_COMMANDS = (
+    ('sudo', 'shutdown', '-h', 'now'),
+    ('sudo', 'poweroff'),
+    ('sudo', '/sbin/shutdown', '-h', 'now'),
+    ('sudo', '/sbin/poweroff'),
+)
 
 # For desktop testing, use a smaller windowed mode
 WINDOWED_WIDTH = 1024
@@ -41,6 +79,19 @@ DARK_BLUE = (0, 0, 139)
 BRIGHT_GREEN = (50, 205, 50)
 HOT_PINK = (255, 20, 147)
 LIGHT_GRAY = (200, 200, 200)
+CART_ROW_BG = (30, 30, 30)
+SCORE_BLINK_COLORS = (YELLOW, RED)  # Game-over score alternates every 500 ms
+
+# Fixed text on the product manager screen
+MANAGER_INSTRUCTIONS = (
+    "E - Export products to CSV file",
+    "I - Import products from CSV file",
+    "ESC - Back to menu"
+)
+CSV_EXAMPLE_LINES = (
+    "SKU,Name,Price,Category,Description,Image",
+    "7501234567890,White Bread,2.20,Bakery,Fresh bread,images/bread.png"
+)
 
 # Game states
 MENU = 0
@@ -50,10 +101,14 @@ GAME_OVER = 3
 PRODUCT_MANAGER = 4
 PAYMENT_MODE = 5
 
+def format_cents(cents):
+    """Format an integer amount of cents as euros"""
+    return f"€{cents // 100}.{cents % 100:02d}"
+
 class ArcadeRetailGame:
     def __init__(self):
         # Check if running in desktop mode (for testing)
-        self.desktop_mode = '--windowed' in os.sys.argv or os.environ.get('ARCADE_WINDOWED', '0') == '1'
+        self.desktop_mode = '--windowed' in sys.argv or os.environ.get('ARCADE_WINDOWED', '0') == '1'
         
         if self.desktop_mode:
             self.screen = pygame.display.set_mode((WINDOWED_WIDTH, WINDOWED_HEIGHT))
@@ -67,28 +122,57 @@ class ArcadeRetailGame:
         pygame.display.set_caption("ASTRID MART - Kids' Shopping Adventure")
         self.clock = pygame.time.Clock()
         
+        # Keep everything else (mouse motion, window events...) out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+        
         # Relative font sizes based on screen height
-        self.font_huge = pygame.font.Font(None, int(self.height * 0.12))     # 12% of screen height
-        self.font_large = pygame.font.Font(None, int(self.height * 0.08))    # 8% of screen height
-        self.font_medium = pygame.font.Font(None, int(self.height * 0.05))   # 5% of screen height
-        self.font_small = pygame.font.Font(None, int(self.height * 0.035))   # 3.5% of screen height
+        # Fonts are created on first use and shared by pixel size (see font())
+        self._fonts = {}
+        
+        # Rendered text surfaces keyed by (font, text, color)
+        self._text_cache = OrderedDict()
+        
+        # Static backgrounds per screen (see _chrome), built on first visit
+        self._chrome_cache = {}
+        
+        # Bordered white cart image frames keyed by size (see _image_frame)
+        self._image_frames = {}
+        
+        # Status lines as (value, surface), re-rendered only when their value changes
+        self.reset_field_caches()
+        
+        # Colors pre-mapped to the screen's pixel format for the cart rows
+        self.map_colors()
+        self.compute_layout()
+        
+        # Scratch rect reused by draw_cart_item instead of allocating per row
+        self._image_rect = pygame.Rect(0, 0, 0, 0)
         
         # Game state
         self.state = MENU
         self.running = True
+        self._dirty = True  # Screen needs redrawing
+        self._anim_rect = None  # Region an animation frame changes (see is_animating)
         
         # Load products and SKUs
         self.products_data = self.load_products()
         self.skus = self.products_data.get('skus', {})
         self.keyboard_shortcuts = self.products_data.get('keyboard_shortcuts', {})
+        self._index_products()
         
         # Load product images
         self.product_images = {}
+        self._scaled_cache = {}  # (sku, size) -> scaled surface
+        self._placeholders = {}  # first letter -> placeholder surface
         self.load_product_images()
         
         # Load storefront banner
         self.storefront_banner = None
         self.load_storefront_banner()
+        self._build_menu_bg()
+        self._build_retail_buttons()
+        self.warm_text()
         
         # Barcode scanning
         self.barcode_buffer = ""
@@ -97,16 +181,21 @@ class ArcadeRetailGame:
         self.last_key_time = 0
         self.scanner_speed_threshold = 100  # milliseconds between keystrokes for scanner detection
         
-        # Retail mode variables
-        self.cart = {}  # Changed to dict to group identical items
-        self.total_price = 0.0
+        # Retail mode variables - the cart is kept as parallel arrays, one
+        # entry per distinct SKU in the order it was first scanned
+        self.reset_cart()
         self.scanned_item = ""
         self.receipt = []
         self.cart_scroll_offset = 0  # For scrolling through cart items
         
         # Payment variables
-        self.payment_amount = 0.0
+        self.payment_cents = 0
         self.payment_step = 0  # 0: amount, 1: paying, 2: change, 3: complete
+        
+        # Receipts are written by one background thread so the disk write
+        # never stalls a frame; the counter keeps same-second names unique
+        self._receipt_writer = ThreadPoolExecutor(max_workers=1)
+        self._receipt_counter = 0
         self.payment_start_time = 0
         
         # Timer mode variables (now learning mode)
@@ -117,20 +206,24 @@ class ArcadeRetailGame:
         self.current_target = None
         self.timer_items_found = []
         self.learning_current_index = 0  # Track progress through products
+        self.learning_product_order = []  # Set when learning mode starts
+        self.learning_total = 0  # len(learning_product_order), for the progress display
         
         # Input handling
         self.last_scan_time = 0
         self.scan_cooldown = 1000  # 1 second cooldown
         
         # Debug mode
-        self.debug_mode = '--debug' in os.sys.argv or os.environ.get('ARCADE_DEBUG', '0') == '1'
+        self.debug_mode = '--debug' in sys.argv or os.environ.get('ARCADE_DEBUG', '0') == '1'
+        logging.basicConfig(stream=sys.stdout, format="%(levelname)s: %(message)s")
+        log.setLevel(logging.DEBUG if self.debug_mode else logging.WARNING)
         if self.debug_mode:
             print("DEBUG MODE ENABLED - Barcode scanner debugging information will be displayed")
             print("To disable debug mode, remove --debug from command line or set ARCADE_DEBUG=0")
         
         # Serial barcode scanner support
         self.serial_scanner = None
-        self.serial_queue = queue.Queue()
+        self.serial_queue = deque()  # Appended by the reader thread, drained by the main loop
         self.serial_thread = None
         self.serial_running = False
         self.setup_serial_scanner()
@@ -148,16 +241,113 @@ class ArcadeRetailGame:
             4: 'player1' # Player 1 button (for shutdown combo)
         }
         self.setup_joystick()
+        self._build_keymaps()
+        
+        # Characters for barcode keys (keypad 0 is not contiguous with KP1-KP9)
+        self._key_to_char = {pygame.K_a + i: chr(pygame.K_a + i) for i in range(26)}
+        for i in range(10):
+            self._key_to_char[pygame.K_0 + i] = str(i)
+            self._key_to_char[getattr(pygame, f"K_KP{i}")] = str(i)
         
         # Shutdown combo tracking
         self.shutdown_combo_start_time = None
         self.shutdown_combo_active = False
         self.SHUTDOWN_COMBO_DURATION = 3.0  # 3 seconds
         
+    def font(self, fraction):
+        """Return the default font sized to a fraction of the screen height, creating it on first use"""
+        size = int(self.height * fraction)
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._fonts[size] = font
+        return font
+    
+    @property
+    def font_huge(self):
+        """12% of screen height"""
+        return self.font(0.12)
+    
+    @property
+    def font_large(self):
+        """8% of screen height"""
+        return self.font(0.08)
+    
+    @property
+    def font_medium(self):
+        """5% of screen height"""
+        return self.font(0.05)
+    
+    @property
+    def font_small(self):
+        """3.5% of screen height"""
+        return self.font(0.035)
+    
+    @property
+    def font_score(self):
+        """20% of screen height, for the game over score"""
+        return self.font(0.2)
+    
     def scale(self, value):
         """Scale a value relative to screen height for responsive design"""
         return int(value * self.height / 768)  # 768 is our base height
     
+    def compute_layout(self):
+        """Resolve the scaled sizes and fixed rects used by the per-frame draw methods"""
+        scale = self.scale
+        self._layout = SimpleNamespace(
+            # draw_cart_item
+            cart_image=scale(90), cart_image_compact=scale(75), cart_padding=scale(8),
+            cart_image_border=scale(4), cart_text_gap=scale(15),
+            cart_price_offset=scale(30), cart_price_offset_compact=scale(22),
+            qty_margin=scale(10), qty_bg_x=scale(8), qty_bg_y=scale(4),
+            qty_bg_w=scale(16), qty_bg_h=scale(8),
+            # draw_retail_mode
+            cart_item_height=scale(95), cart_item_spacing=scale(105),
+            col_gap=scale(20), col_height=scale(90), row_spacing=scale(100),
+            status_gap=scale(30),
+            # draw_timer_mode
+            target_image_gap=scale(40), target_name_gap=scale(25), feedback_gap=scale(50),
+        )
+        layout = self._layout
+        
+        # Rects that only depend on the resolution
+        layout.cart_area = pygame.Rect(self.width * 0.05, self.height * 0.12, 
+                                       self.width * 0.9, self.height * 0.4)
+        
+        # Payment screen buttons
+        button_width = self.width * 0.3
+        button_height = self.height * 0.08
+        button_x = self.width//2 - button_width//2
+        layout.pay_button = pygame.Rect(button_x, self.height * 0.6, button_width, button_height)
+        layout.cancel_button = pygame.Rect(button_x, self.height * 0.75, button_width, button_height)
+        layout.continue_button = pygame.Rect(button_x, self.height * 0.7, button_width, button_height)
+        layout.receipt_button = layout.pay_button  # Same spot, next step
+        shop_width = self.width * 0.35
+        layout.continue_shopping_button = pygame.Rect(self.width//2 - shop_width//2, self.height * 0.65,
+                                                      shop_width, button_height)
+        
+        # Learning mode exit button
+        exit_width = self.width * 0.25
+        layout.exit_button = pygame.Rect(self.width//2 - exit_width//2, self.height * 0.95,
+                                         exit_width, self.height * 0.06)
+        
+        # Title boxes around the fixed payment and product manager titles
+        title = self._text(self.font_large, "PAYMENT", GREEN)
+        layout.payment_title = title.get_rect(center=(self.width//2, self.height * 0.15))
+        layout.payment_title_bg = pygame.Rect(layout.payment_title.x - scale(20), layout.payment_title.y - scale(10), 
+                                              layout.payment_title.width + scale(40), layout.payment_title.height + scale(20))
+        title = self._text(self.font_large, "PRODUCT MANAGER", PURPLE)
+        layout.manager_title = title.get_rect(center=(self.width//2, self.height * 0.1))
+        layout.manager_title_bg = pygame.Rect(layout.manager_title.x - 20, layout.manager_title.y - 10, 
+                                              layout.manager_title.width + 40, layout.manager_title.height + 20)
+        
+        # Band between "Processing Payment..." and its button where the dots animate
+        processing = self._text(self.font_large, "Processing Payment...", YELLOW)
+        processing_rect = processing.get_rect(center=(self.width//2, self.height * 0.4))
+        layout.payment_dots_band = pygame.Rect(0, processing_rect.bottom, self.width,
+                                               layout.continue_button.y - processing_rect.bottom)
+    
     def scale_width(self, value):
         """Scale a value relative to screen width for responsive design"""
         return int(value * self.width / 1024)  # 1024 is our base width
@@ -165,8 +355,7 @@ class ArcadeRetailGame:
     def load_products(self):
         """Load products from JSON file"""
         try:
-            with open('products.json', 'r') as f:
-                return json.load(f)
+            return self.read_products('products.json')
         except FileNotFoundError:
             # Create default products if file doesn't exist
             default_data = {
@@ -190,25 +379,77 @@ class ArcadeRetailGame:
             self.save_products(default_data)
             return default_data
     
+    def _index_products(self):
+        """Precompute lookup helpers for the current SKU table"""
+        self._sku_lengths = {len(sku) for sku in self.skus}
+        self._products = tuple(self.skus.values())  # Population learning mode samples its order from
+        
+        # Product name -> first SKU with that name, for learning mode targets
+        self._name_to_sku = {}
+        for sku, product in self.skus.items():
+            self._name_to_sku.setdefault(product['name'], sku)
+        
+        # Prices in integer cents, so totals never accumulate float error
+        self._sku_cents = {sku: round(float(product['price']) * 100) for sku, product in self.skus.items()}
+        
+        # Shortcut key -> SKU / product, limited to SKUs that actually exist
+        self._shortcut_to_sku = {key: sku for key, sku in self.keyboard_shortcuts.items() if sku in self.skus}
+        self._shortcut_to_product = {key: self.skus[sku] for key, sku in self._shortcut_to_sku.items()}
+    
     def load_product_images(self):
         """Load all product images at original resolution to preserve quality"""
         print("Loading product images...")
+        self._scaled_cache.clear()
+        to_load = []
         for sku, product in self.skus.items():
             image_path = product.get('image', '')
             if image_path and os.path.exists(image_path):
-                try:
-                    # Load image at original resolution - don't scale here!
-                    image = pygame.image.load(image_path)
-                    self.product_images[sku] = image
-                    print(f"Loaded image for {product['name']}")
-                except pygame.error as e:
-                    print(f"Could not load image for {product['name']}: {e}")
-                    self.product_images[sku] = self.create_placeholder_image(product['name'])
+                to_load.append(sku)
             else:
                 print(f"Image not found for {product['name']}, using placeholder")
                 self.product_images[sku] = self.create_placeholder_image(product['name'])
+        
+        # Decode the files in parallel - SDL_image releases the GIL while decoding
+        paths = [self.skus[sku]['image'] for sku in to_load]
+        with ThreadPoolExecutor(max_workers=IMAGE_LOAD_WORKERS) as executor:
+            decoded = list(executor.map(self._decode_image, paths))
+        
+        # Converting to the display format has to happen on the main thread
+        for sku, result in zip(to_load, decoded):
+            product = self.skus[sku]
+            if isinstance(result, pygame.Surface):
+                # Load image at original resolution - don't scale here!
+                self.product_images[sku] = self.to_display_format(result)
+                print(f"Loaded image for {product['name']}")
+            else:
+                print(f"Could not load image for {product['name']}: {result}")
+                self.product_images[sku] = self.create_placeholder_image(product['name'])
+    
+    @staticmethod
+    def to_display_format(image):
+        """Convert a loaded image to the screen format, keeping per-pixel alpha only if it has any"""
+        if image.get_flags() & pygame.SRCALPHA:
+            return image.convert_alpha()
+        return image.convert()
+    
+    @staticmethod
+    def _decode_image(image_path):
+        """Decode one image file (runs in a worker thread), returning the error instead of raising"""
+        try:
+            return pygame.image.load(image_path)
+        except pygame.error as e:
+            return e
     
     def create_placeholder_image(self, product_name):
+        """Return the placeholder for a product, shared by all products with the same initial"""
+        letter = product_name[0] if product_name else "?"
+        surface = self._placeholders.get(letter)
+        if surface is None:
+            surface = self._render_placeholder(letter)
+            self._placeholders[letter] = surface
+        return surface
+    
+    def _render_placeholder(self, letter):
         """Create a simple placeholder image at higher resolution"""
         surface = pygame.Surface((200, 200))
         surface.fill(LIGHT_GRAY)
@@ -216,13 +457,29 @@ class ArcadeRetailGame:
         
         # Add first letter of product name - bigger font
         font = pygame.font.Font(None, 150)
-        letter = product_name[0] if product_name else "?"
         text = font.render(letter, True, BLACK)
         text_rect = text.get_rect(center=(100, 100))
         surface.blit(text, text_rect)
         
+        return surface.convert()
+    
+    def get_scaled_image(self, sku, size):
+        """Return the product image scaled to size x size, scaling only once per size"""
+        key = (sku, size)
+        surface = self._scaled_cache.get(key)
+        if surface is None:
+            surface = self.smooth_scale(self.product_images[sku], (size, size))
+            self._scaled_cache[key] = surface
         return surface
     
+    @staticmethod
+    def smooth_scale(image, size):
+        """Scale with smoothscale (SIMD-accelerated) where the surface format allows it"""
+        # smoothscale only handles 24/32-bit surfaces (opaque images on a 16-bit screen aren't)
+        if image.get_bitsize() >= 24:
+            return pygame.transform.smoothscale(image, size)
+        return pygame.transform.scale(image, size)
+    
     def load_storefront_banner(self):
         """Load the storefront banner image"""
         banner_path = "images/storefront.png"
@@ -233,7 +490,9 @@ class ArcadeRetailGame:
                 # Scale to full width while maintaining aspect ratio
                 banner_width = self.width
                 banner_height = int(banner.get_height() * (banner_width / banner.get_width()))
-                self.storefront_banner = pygame.transform.scale(banner, (banner_width, banner_height))
+                # Convert first so the scaled copy is already in the display format
+                banner = self.to_display_format(banner)
+                self.storefront_banner = self.smooth_scale(banner, (banner_width, banner_height))
                 print(f"Loaded storefront banner: {banner_width}x{banner_height}")
             except pygame.error as e:
                 print(f"Could not load storefront banner: {e}")
@@ -242,19 +501,48 @@ class ArcadeRetailGame:
             print("Storefront banner not found")
             self.storefront_banner = None
     
+    def read_products(self, products_file):
+        """Parse the products file, using the marshalled cache if it's up to date"""
+        mtime = os.stat(products_file).st_mtime_ns
+        cache_file = os.path.splitext(products_file)[0] + '.cache'
+        try:
+            with open(cache_file, 'rb') as f:
+                cached_mtime, products_data = marshal.load(f)
+            if cached_mtime == mtime:
+                return products_data
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        
+        with open(products_file, 'rb') as f:
+            products_data = json_loads(f.read())
+        self.write_products_cache(cache_file, mtime, products_data)
+        return products_data
+    
+    def write_products_cache(self, cache_file, mtime, products_data):
+        """Store parsed products keyed by the mtime of the JSON they came from"""
+        try:
+            with open(cache_file, 'wb') as f:
+                marshal.dump((mtime, products_data), f)
+        except (OSError, ValueError) as e:
+            print(f"Could not write products cache: {e}")
+    
     def save_products(self, products_data):
         """Save products to JSON file"""
-        with open('products.json', 'w') as f:
-            json.dump(products_data, f, indent=2)
+        # Write a temp file and swap it in so a crash can't leave a half-written catalog
+        with open('products.json.tmp', 'wb') as f:
+            f.write(json_dumps(products_data))
+        os.replace('products.json.tmp', 'products.json')
+        # Refresh the cache now so the next startup doesn't re-parse
+        self.write_products_cache('products.cache', os.stat('products.json').st_mtime_ns, products_data)
     
     def export_products_csv(self):
         """Export products to CSV for easy editing"""
         try:
-            with open('products.csv', 'w', newline='') as f:
+            with open('products.csv', 'w', newline='', buffering=CSV_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(['SKU', 'Name', 'Price', 'Category', 'Description', 'Image'])
-                for sku, product in self.skus.items():
-                    writer.writerow([sku, product['name'], product['price'], product['category'], product.get('description', ''), product.get('image', '')])
+                writer.writerows([sku, product['name'], product['price'], product['category'], product.get('description', ''), product.get('image', '')]
+                                 for sku, product in self.skus.items())
             return True
         except Exception as e:
             print(f"Error exporting CSV: {e}")
@@ -263,21 +551,37 @@ class ArcadeRetailGame:
     def import_products_csv(self):
         """Import products from CSV"""
         try:
-            with open('products.csv', 'r') as f:
-                reader = csv.DictReader(f)
+            with open('products.csv', 'r', buffering=CSV_BUFFER_SIZE) as f:
+                # Plain rows indexed by column position; Description and Image are optional
+                reader = csv.reader(f)
+                header = next(reader, [])
+                columns = {name: i for i, name in enumerate(header)}
+                sku_col, name_col, price_col, category_col = (columns[name] for name in ('SKU', 'Name', 'Price', 'Category'))
+                description_col = columns.get('Description')
+                image_col = columns.get('Image')
                 new_skus = {}
                 for row in reader:
-                    new_skus[row['SKU']] = {
-                        'name': row['Name'],
-                        'price': float(row['Price']),
-                        'category': row['Category'],
-                        'description': row.get('Description', ''),
-                        'image': row.get('Image', '')
+                    # Pad short rows (dropped trailing columns) so every column index
+                    # exists and skip blank lines. A bad price fails the whole import
+                    # below, leaving the current catalog untouched, since the new one
+                    # replaces it completely.
+                    if len(row) < len(header):
+                        row += [''] * (len(header) - len(row))
+                    if not row[sku_col].strip():
+                        continue
+                    new_skus[row[sku_col]] = {
+                        'name': row[name_col],
+                        'price': float(row[price_col]),
+                        'category': row[category_col],
+                        'description': row[description_col] if description_col is not None else '',
+                        'image': row[image_col] if image_col is not None else ''
                     }
                 self.skus = new_skus
                 self.products_data['skus'] = new_skus
+                self._index_products()
                 self.save_products(self.products_data)
                 self.load_product_images()  # Reload images
+                self._text_cache.clear()
             return True
         except Exception as e:
             print(f"Error importing CSV: {e}")
@@ -296,14 +600,12 @@ class ArcadeRetailGame:
             # Look for common barcode scanner patterns
             for port in ports:
                 port_name = port.device.lower()
-                if self.debug_mode:
-                    print(f"DEBUG: Found serial port: {port.device} - {port.description}")
+                log.debug("Found serial port: %s - %s", port.device, port.description)
                 
                 # Check for USB modem patterns (like your scanner)
                 if 'usbmodem' in port_name or 'usb' in port.description.lower():
                     scanner_port = port.device
-                    if self.debug_mode:
-                        print(f"DEBUG: Potential scanner port: {scanner_port}")
+                    log.debug("Potential scanner port: %s", scanner_port)
                     break
             
             if scanner_port:
@@ -314,7 +616,7 @@ class ArcadeRetailGame:
                     bytesize=serial.EIGHTBITS,
                     parity=serial.PARITY_NONE,
                     stopbits=serial.STOPBITS_ONE,
-                    timeout=0.1
+                    timeout=0.05  # read_until returns at the latest after this
                 )
                 print(f"🔍 Serial barcode scanner connected: {scanner_port}")
                 
@@ -323,60 +625,69 @@ class ArcadeRetailGame:
                 self.serial_thread = threading.Thread(target=self.read_serial_scanner, daemon=True)
                 self.serial_thread.start()
             else:
-                if self.debug_mode:
-                    print("DEBUG: No serial barcode scanner found")
+                log.debug("No serial barcode scanner found")
                     
         except Exception as e:
-            if self.debug_mode:
-                print(f"DEBUG: Serial scanner setup failed: {e}")
+            log.debug("Serial scanner setup failed: %s", e)
     
     def read_serial_scanner(self):
         """Read data from serial barcode scanner"""
         if not self.serial_scanner:
             return
         
-        barcode_buffer = ""
+        # Keep this thread out of the render loop's way: on Linux both calls
+        # apply to the calling thread only. Not available on macOS/Windows.
+        try:
+            os.nice(5)
+        except (AttributeError, OSError) as e:
+            log.debug("Could not lower serial thread priority: %s", e)
+        try:
+            allowed_cpus = os.sched_getaffinity(0)
+            if len(allowed_cpus) > 1:
+                os.sched_setaffinity(0, {max(allowed_cpus)})
+        except (AttributeError, OSError) as e:
+            log.debug("Could not pin serial thread to a CPU: %s", e)
+        
+        barcode_buffer = bytearray()  # Grows in place across partial reads
+        read_until = self.serial_scanner.read_until
+        queue_barcode = self.serial_queue.append
         
         while self.serial_running:
             try:
-                if self.serial_scanner.in_waiting > 0:
-                    # Read available data
-                    data = self.serial_scanner.read(self.serial_scanner.in_waiting)
-                    text = data.decode('utf-8', errors='ignore').strip()
-                    
-                    if text:
-                        if self.debug_mode:
-                            print(f"DEBUG: Serial scanner received: '{text}'")
-                        
-                        # Check if this looks like a complete barcode
-                        if len(text) >= 8 and text.isalnum():
-                            # Put complete barcode in queue
-                            self.serial_queue.put(text)
-                            if self.debug_mode:
-                                print(f"DEBUG: Serial scanner queued barcode: '{text}'")
-                        else:
-                            # Handle partial data
-                            barcode_buffer += text
-                            if len(barcode_buffer) >= 8 and barcode_buffer.isalnum():
-                                self.serial_queue.put(barcode_buffer)
-                                if self.debug_mode:
-                                    print(f"DEBUG: Serial scanner queued buffered barcode: '{barcode_buffer}'")
-                                barcode_buffer = ""
+                # Block in the OS until the scanner sends a CR-terminated code
+                # (or the port timeout expires) instead of polling in_waiting.
+                # Scanners send plain ASCII, so the checks run on the raw bytes
+                # and only queued codes get decoded.
+                data = read_until(b'\r').strip()
                 
-                time.sleep(0.01)  # Small delay to prevent busy waiting
+                if data:
+                    log.debug("Serial scanner received: %r", data)
+                    
+                    # Check if this looks like a complete barcode
+                    if len(data) >= 8 and data.isalnum():
+                        # Put complete barcode in queue
+                        queue_barcode(data.decode('ascii'))
+                        log.debug("Serial scanner queued barcode: %r", data)
+                    else:
+                        # Handle partial data (scanners that don't send CR)
+                        barcode_buffer += data
+                        if len(barcode_buffer) >= 8 and barcode_buffer.isalnum():
+                            queue_barcode(barcode_buffer.decode('ascii'))
+                            log.debug("Serial scanner queued buffered barcode: %r", barcode_buffer)
+                            barcode_buffer.clear()
                 
             except Exception as e:
-                if self.debug_mode:
-                    print(f"DEBUG: Serial scanner read error: {e}")
+                log.debug("Serial scanner read error: %s", e)
                 time.sleep(0.1)
     
     def check_serial_scanner(self):
         """Check for serial scanner input"""
         try:
-            while not self.serial_queue.empty():
-                barcode = self.serial_queue.get_nowait()
-                if self.debug_mode:
-                    print(f"DEBUG: Processing serial barcode: '{barcode}'")
+            # deque append/popleft are atomic, so no lock is needed
+            while self.serial_queue:
+                barcode = self.serial_queue.popleft()
+                self._dirty = True
+                log.debug("Processing serial barcode: '%s'", barcode)
                 
                 # Process the barcode based on current state
                 if self.state == RETAIL_MODE:
@@ -384,11 +695,8 @@ class ArcadeRetailGame:
                 elif self.state == TIMER_MODE:
                     self.scan_timer_item(barcode)
                     
-        except queue.Empty:
-            pass
         except Exception as e:
-            if self.debug_mode:
-                print(f"DEBUG: Serial scanner check error: {e}")
+            log.debug("Serial scanner check error: %s", e)
     
     def setup_joystick(self):
         """Setup joystick/arcade controller if available"""
@@ -399,15 +707,13 @@ class ArcadeRetailGame:
             self.joystick = pygame.joystick.Joystick(0)
             self.joystick.init()
             
-            if self.debug_mode:
-                print(f"DEBUG: Joystick connected: {self.joystick.get_name()}")
-                print(f"DEBUG: Joystick buttons: {self.joystick.get_numbuttons()}")
-                print(f"DEBUG: Button mapping: {self.joystick_button_mapping}")
+            log.debug("Joystick connected: %s", self.joystick.get_name())
+            log.debug("Joystick buttons: %s", self.joystick.get_numbuttons())
+            log.debug("Button mapping: %s", self.joystick_button_mapping)
             
             print(f"🕹️  Arcade controller connected: {self.joystick.get_name()}")
         else:
-            if self.debug_mode:
-                print("DEBUG: No joystick/arcade controller detected")
+            log.debug("No joystick/arcade controller detected")
     
     def process_barcode_input(self, key_char):
         """Process barcode character input from scanner or keyboard"""
@@ -415,16 +721,15 @@ class ArcadeRetailGame:
         
         # Reset buffer if timeout exceeded
         if current_time - self.barcode_input_time > self.barcode_timeout:
-            if self.debug_mode and self.barcode_buffer:
-                print(f"DEBUG: Barcode buffer timeout, clearing: '{self.barcode_buffer}'")
+            if self.barcode_buffer:
+                log.debug("Barcode buffer timeout, clearing: '%s'", self.barcode_buffer)
             self.barcode_buffer = ""
         
         # Detect if this is scanner input (very fast keystrokes)
         time_since_last_key = current_time - self.last_key_time
         is_scanner_speed = time_since_last_key < self.scanner_speed_threshold
         
-        if self.debug_mode:
-            print(f"DEBUG: Time since last key: {time_since_last_key}ms, is_scanner_speed: {is_scanner_speed}")
+        log.debug("Time since last key: %sms, is_scanner_speed: %s", time_since_last_key, is_scanner_speed)
         
         # Add character to buffer (accept alphanumeric characters)
         if key_char.isalnum():
@@ -435,32 +740,28 @@ class ArcadeRetailGame:
                 self.last_key_time = current_time
                 
                 # Show scanning feedback
-                if len(self.barcode_buffer) > 0:
-                    self.scanned_item = f"🔍 Scanning: {self.barcode_buffer}"
+                self.scanned_item = "🔍 Scanning: " + self.barcode_buffer
                 
-                if self.debug_mode:
-                    print(f"DEBUG: Added to buffer: '{key_char}', buffer now: '{self.barcode_buffer}'")
+                log.debug("Added to buffer: '%s', buffer now: '%s'", key_char, self.barcode_buffer)
                 
                 # Check if we have a complete barcode (8-13 characters for various barcode types)
                 if len(self.barcode_buffer) >= 8:  # Accept shorter barcodes too
                     # For our specific products, check if this matches any SKU
-                    if self.barcode_buffer in self.skus:
+                    # Only hash the buffer once it's as long as some real SKU
+                    if len(self.barcode_buffer) in self._sku_lengths and self.barcode_buffer in self.skus:
                         barcode = self.barcode_buffer
                         self.barcode_buffer = ""
-                        if self.debug_mode:
-                            print(f"DEBUG: Found matching SKU: '{barcode}'")
+                        log.debug("Found matching SKU: '%s'", barcode)
                         return barcode
                     # Standard 13-character barcode
                     elif len(self.barcode_buffer) >= 13:
                         barcode = self.barcode_buffer
                         self.barcode_buffer = ""
-                        if self.debug_mode:
-                            print(f"DEBUG: Complete 13-char barcode: '{barcode}'")
+                        log.debug("Complete 13-char barcode: '%s'", barcode)
                         return barcode
             else:
                 # Manual keyboard input - reset buffer for single key presses
-                if self.debug_mode:
-                    print(f"DEBUG: Manual input detected, resetting buffer to: '{key_char}'")
+                log.debug("Manual input detected, resetting buffer to: '%s'", key_char)
                 self.barcode_buffer = key_char
                 self.barcode_input_time = current_time
                 self.last_key_time = current_time
@@ -479,35 +780,52 @@ class ArcadeRetailGame:
     
     def lookup_product(self, barcode_or_key):
         """Look up product by barcode or keyboard shortcut"""
-        # First check if it's a keyboard shortcut
-        if barcode_or_key in self.keyboard_shortcuts:
-            sku = self.keyboard_shortcuts[barcode_or_key]
-            return self.skus.get(sku)
-        
-        # Then check if it's a direct SKU lookup
+        product = self._shortcut_to_product.get(barcode_or_key)
+        if product is not None:
+            return product
         return self.skus.get(barcode_or_key)
     
+    def reset_cart(self):
+        """Empty the cart arrays and running total"""
+        self.cart_skus = []                 # SKU per cart line
+        self.cart_names = []                # Product name per cart line
+        self.cart_qty = array('i')          # Quantity per cart line
+        self.cart_price_cents = array('i')  # Unit price per cart line, in cents
+        self.cart_price_strs = []           # Formatted unit price per cart line
+        self.cart_qty_strs = []             # Formatted quantity per cart line
+        self._sku_index = {}                # SKU -> cart line
+        self.total_cents = 0
+        self._receipt_body = None           # Cached receipt lines, rebuilt after cart changes
+        self._compute_visible()
+    
+    def _compute_visible(self):
+        """Update how many cart lines fit on screen and how far the list can scroll"""
+        total_items = len(self.cart_skus)
+        max_displayable = 4 if total_items <= 4 else 8  # 1 column up to 4 lines, then 2
+        self._visible_n = min(max_displayable, total_items)
+        self._max_scroll = max(0, total_items - max_displayable)
+    
     def add_to_cart(self, product, sku):
         """Add product to cart and update receipt"""
-        if sku in self.cart:
+        self._receipt_body = None
+        index = self._sku_index.get(sku)
+        if index is not None:
             # Item already in cart, increase quantity
-            self.cart[sku]['quantity'] += 1
-            self.cart[sku]['total_price'] += product['price']
+            self.cart_qty[index] += 1
+            self.cart_qty_strs[index] = f"x{self.cart_qty[index]}"
         else:
             # New item, add to cart
-            self.cart[sku] = {
-                'sku': sku,
-                'name': product['name'],
-                'price': product['price'],
-                'quantity': 1,
-                'total_price': product['price'],
-                'category': product['category'],
-                'description': product.get('description', ''),
-                'image_path': product.get('image', ''),
-                'first_added': time.time()
-            }
-        
-        self.total_price += product['price']
+            index = len(self.cart_skus)
+            self._sku_index[sku] = index
+            self.cart_skus.append(sku)
+            self.cart_names.append(product['name'])
+            self.cart_qty.append(1)
+            self.cart_price_cents.append(self._sku_cents[sku])
+            self.cart_price_strs.append(format_cents(self._sku_cents[sku]))
+            self.cart_qty_strs.append("x1")
+            self._compute_visible()
+        
+        self.total_cents += self.cart_price_cents[index]
         
         # Update receipt
         self.receipt.append({
@@ -516,108 +834,179 @@ class ArcadeRetailGame:
             'timestamp': time.strftime('%H:%M:%S')
         })
         
-        quantity = self.cart[sku]['quantity']
-        return f"Added: {product['name']} (€{product['price']:.2f}) [Qty: {quantity}]"
+        quantity = self.cart_qty[index]
+        return f"Added: {product['name']} ({self.cart_price_strs[index]}) [Qty: {quantity}]"
     
     def generate_receipt(self):
         """Generate a formatted receipt"""
-        if not self.cart:
+        if not self.cart_skus:
             return []
         
+        # Everything but the date only changes when the cart does
+        if self._receipt_body is None:
+            self._receipt_body = self._build_receipt_body()
+        
         receipt_lines = []
         receipt_lines.append("=" * 40)
         receipt_lines.append("     ARCADE RETAIL STORE")
         receipt_lines.append("=" * 40)
         receipt_lines.append(f"Date: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        receipt_lines.extend(self._receipt_body)
+        
+        return receipt_lines
+    
+    def _build_receipt_body(self):
+        """Format the receipt lines below the date (items and totals)"""
+        receipt_lines = []
         receipt_lines.append("-" * 40)
         
-        for sku, item in self.cart.items():
-            if item['quantity'] > 1:
-                receipt_lines.append(f"{item['name']} x{item['quantity']:<16} €{item['total_price']:.2f}")
-                receipt_lines.append(f"  (€{item['price']:.2f} each)")
+        for name, quantity, price_cents in zip(self.cart_names, self.cart_qty, self.cart_price_cents):
+            if quantity > 1:
+                receipt_lines.append(f"{name} x{quantity:<16} {format_cents(quantity * price_cents)}")
+                receipt_lines.append(f"  ({format_cents(price_cents)} each)")
             else:
-                receipt_lines.append(f"{item['name']:<25} €{item['price']:.2f}")
+                receipt_lines.append(f"{name:<25} {format_cents(price_cents)}")
         
         receipt_lines.append("-" * 40)
-        total_items = sum(item['quantity'] for item in self.cart.values())
+        total_items = sum(self.cart_qty)
         receipt_lines.append(f"Total Items: {total_items}")
-        receipt_lines.append(f"{'TOTAL:':<25} €{self.total_price:.2f}")
+        receipt_lines.append(f"{'TOTAL:':<25} {format_cents(self.total_cents)}")
         receipt_lines.append("=" * 40)
         receipt_lines.append("    Thank you for shopping!")
         receipt_lines.append("=" * 40)
         
         return receipt_lines
     
-    def draw_border_box(self, rect, color, thickness=3):
-        """Draw a decorative border box"""
-        pygame.draw.rect(self.screen, color, rect, thickness)
+    def reset_field_caches(self):
+        """Forget the rendered status lines so they are drawn again with the current fonts"""
+        self._total_cache = (None, None)
+        self._message_cache = (None, None)
+        self._amount_cache = (None, None)
+        self._progress_cache = (None, None)
+        self._score_cache = (None, None)
+        self._count_cache = (None, None)
+        self._out_of_cache = (None, None)
+    
+    def _text(self, font, text, color):
+        """Render text through a bounded cache so unchanged strings aren't re-rasterized every frame"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+    
+    def map_colors(self):
+        """Map the cart row colors to pixel values for the current screen format"""
+        self._mapped = {color: self.screen.map_rgb(color)
+                        for color in (HOT_PINK, CART_ROW_BG)}
+    
+    def _image_frame(self, size):
+        """Return the white, gray-bordered box drawn behind a cart image of the given size"""
+        frame = self._image_frames.get(size)
+        if frame is None:
+            frame = pygame.Surface((size, size)).convert()
+            frame.fill(WHITE)
+            pygame.draw.rect(frame, LIGHT_GRAY, frame.get_rect(), 2)
+            self._image_frames[size] = frame
+        return frame
+    
+    def blit_all(self, blit_list):
+        """Blit a list of (surface, dest) pairs to the screen in one call"""
+        if HAS_FBLITS:
+            self.screen.fblits(blit_list)
+        else:
+            self.screen.blits(blit_list, doreturn=0)
+    
+    def draw_border_box(self, rect, color, thickness=3, surface=None):
+        """Draw a decorative border box (on the screen unless another surface is given)"""
+        if surface is None:
+            surface = self.screen
+        pygame.draw.rect(surface, color, rect, thickness)
         # Add corner decorations
         corner_size = thickness * 2
-        pygame.draw.rect(self.screen, color, (rect.x, rect.y, corner_size, corner_size))
-        pygame.draw.rect(self.screen, color, (rect.x + rect.width - corner_size, rect.y, corner_size, corner_size))
-        pygame.draw.rect(self.screen, color, (rect.x, rect.y + rect.height - corner_size, corner_size, corner_size))
-        pygame.draw.rect(self.screen, color, (rect.x + rect.width - corner_size, rect.y + rect.height - corner_size, corner_size, corner_size))
+        pygame.draw.rect(surface, color, (rect.x, rect.y, corner_size, corner_size))
+        pygame.draw.rect(surface, color, (rect.x + rect.width - corner_size, rect.y, corner_size, corner_size))
+        pygame.draw.rect(surface, color, (rect.x, rect.y + rect.height - corner_size, corner_size, corner_size))
+        pygame.draw.rect(surface, color, (rect.x + rect.width - corner_size, rect.y + rect.height - corner_size, corner_size, corner_size))
     
-    def draw_cart_item(self, item, item_bg, cart_area, is_compact=False):
-        """Draw a single cart item - supports both regular and compact layouts"""
+    def draw_cart_item(self, index, item_bg, cart_area, blits, qty_badges, is_compact=False):
+        """Draw cart line index, queueing its blits and quantity badge for one batched pass"""
+        sku = self.cart_skus[index]
+        quantity = self.cart_qty[index]
+        layout = self._layout
+        
         # Adjust sizes based on layout type - responsive sizing
         if is_compact:
-            image_size = self.scale(75)  # Responsive image size for compact layout
+            image_size = layout.cart_image_compact  # Responsive image size for compact layout
             font_name = self.font_small
             font_price = self.font_small
             font_qty = self.font_large
         else:
-            image_size = self.scale(90)  # Responsive image size for single column
+            image_size = layout.cart_image  # Responsive image size for single column
             font_name = self.font_medium
             font_price = self.font_medium
             font_qty = self.font_huge
         
         # Product image - prominent and clean - responsive padding
-        padding = self.scale(8)
-        image_rect = pygame.Rect(item_bg.x + padding, item_bg.y + padding, image_size, image_size)
-        if item['sku'] in self.product_images:
+        padding = layout.cart_padding
+        image_rect = self._image_rect
+        image_rect.update(item_bg.x + padding, item_bg.y + padding, image_size, image_size)
+        if sku in self.product_images:
             # White background with subtle border for prominence
-            pygame.draw.rect(self.screen, WHITE, image_rect)
-            pygame.draw.rect(self.screen, (200, 200, 200), image_rect, 2)
+            blits.append((self._image_frame(image_size), image_rect.topleft))
             
             # Scale original image to cart size - responsive border
-            border = self.scale(4)
-            image = self.product_images[item['sku']]
-            image_scaled = pygame.transform.scale(image, (image_size - border, image_size - border))
+            border = layout.cart_image_border
+            image_scaled = self.get_scaled_image(sku, image_size - border)
             image_center = (image_rect.centerx - (image_size - border)//2, image_rect.centery - (image_size - border)//2)
-            self.screen.blit(image_scaled, image_center)
+            blits.append((image_scaled, image_center))
         
         # Product details - simple text - responsive spacing
-        text_x = image_rect.right + self.scale(15)
+        text_x = image_rect.right + layout.cart_text_gap
         
         # Product name - truncate if too long for compact layout
-        name = item['name']
+        name = self.cart_names[index]
         if is_compact and len(name) > 15:
             name = name[:12] + "..."
         
-        name_text = font_name.render(name, True, WHITE)
-        self.screen.blit(name_text, (text_x, item_bg.y + padding))
+        name_text = self._text(font_name, name, WHITE)
+        blits.append((name_text, (text_x, item_bg.y + padding)))
         
         # Price - responsive spacing
-        price_text = font_price.render(f"€{item['price']:.2f}", True, YELLOW)
-        price_y = item_bg.y + padding + (self.scale(30) if not is_compact else self.scale(22))
-        self.screen.blit(price_text, (text_x, price_y))
+        price_text = self._text(font_price, self.cart_price_strs[index], YELLOW)
+        price_y = item_bg.y + padding + (layout.cart_price_offset if not is_compact else layout.cart_price_offset_compact)
+        blits.append((price_text, (text_x, price_y)))
         
         # Quantity - HUGE for kids, clean design - responsive sizing
-        if item['quantity'] > 1:
-            qty_text = font_qty.render(f"x{item['quantity']}", True, BLACK)
+        if quantity > 1:
+            qty_text = self._text(font_qty, self.cart_qty_strs[index], BLACK)
             qty_rect = qty_text.get_rect()
-            qty_rect.topright = (item_bg.right - self.scale(10), item_bg.y + padding)
+            qty_rect.topright = (item_bg.right - layout.qty_margin, item_bg.y + padding)
             
             # Simple quantity background - responsive padding
-            qty_bg = pygame.Rect(qty_rect.x - self.scale(8), qty_rect.y - self.scale(4), 
-                                qty_rect.width + self.scale(16), qty_rect.height + self.scale(8))
-            pygame.draw.rect(self.screen, HOT_PINK, qty_bg)
-            self.screen.blit(qty_text, qty_rect)
+            # Drawn after all text so it stays on top of long names
+            qty_bg = pygame.Rect(qty_rect.x - layout.qty_bg_x, qty_rect.y - layout.qty_bg_y,
+                                 qty_rect.width + layout.qty_bg_w, qty_rect.height + layout.qty_bg_h)
+            qty_badges.append((qty_bg, qty_text, qty_rect))
     
     def handle_events(self):
         """Handle keyboard and other events"""
-        for event in pygame.event.get():
+        # Pump SDL once per frame; peek and get below then only read the queue
+        pygame.event.pump()
+        
+        # Most frames have nothing queued - skip building an empty event list
+        if not pygame.event.peek(HANDLED_EVENTS, pump=False):
+            return
+        
+        # Any input can change what's on screen
+        self._dirty = True
+        
+        for event in pygame.event.get(pump=False):
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -633,198 +1022,127 @@ class ArcadeRetailGame:
                 elif event.key == pygame.K_F11:
                     self.toggle_fullscreen()
                 
-                elif self.state == MENU:
-                    # Keyboard controls for testing (hidden from UI)
-                    if event.key == pygame.K_1:
-                        self.start_retail_mode()
-                    elif event.key == pygame.K_2:
-                        self.start_timer_mode()
-                    elif event.key == pygame.K_3:
-                        self.state = PRODUCT_MANAGER
-                    elif event.key == pygame.K_q:
-                        self.running = False
-                    # Arcade colored buttons for actual game
-                    elif event.key == pygame.K_x:  # GREEN button (K1) - Self-checkout
-                        self.start_retail_mode()
-                    elif event.key == pygame.K_p:  # BLUE button (K2) - Learning mode
-                        self.start_timer_mode()
-                    elif event.key == pygame.K_c:  # YELLOW button (K3) - Product manager
-                        self.state = PRODUCT_MANAGER
-                    elif event.key == pygame.K_ESCAPE:  # RED button (K4) - Quit game
-                        self.running = False
-                
-                elif self.state == RETAIL_MODE:
-                    if event.key == pygame.K_x:  # GREEN button (K1) - Checkout
-                        self.start_payment()
-                    elif event.key == pygame.K_p:  # BLUE button (K2) - Remove last item
-                        self.remove_last_item()
-                    elif event.key == pygame.K_c:  # YELLOW button (K3) - Clear cart
-                        self.clear_cart()
-                    elif event.key == pygame.K_r:  # Print receipt (keyboard only)
-                        self.print_receipt()
-                    elif event.key == pygame.K_UP:  # Scroll up in cart
-                        if self.cart_scroll_offset > 0:
-                            self.cart_scroll_offset -= 1
-                    elif event.key == pygame.K_DOWN:  # Scroll down in cart
-                        # Dynamic scrolling based on cart size
-                        total_items = len(self.cart)
-                        max_displayable = 4 if total_items <= 4 else 8
-                        if total_items > max_displayable:
-                            max_scroll = total_items - max_displayable
-                            if self.cart_scroll_offset < max_scroll:
-                                self.cart_scroll_offset += 1
-                    elif event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:  # Enter key (barcode completion)
-                        if self.barcode_buffer:
-                            if self.debug_mode:
-                                print(f"DEBUG: Enter pressed, processing barcode: '{self.barcode_buffer}'")
-                            complete_barcode = self.process_barcode_complete(self.barcode_buffer)
-                            if complete_barcode:
-                                if self.debug_mode:
-                                    print(f"DEBUG: Barcode accepted: '{complete_barcode}'")
-                                self.scan_item(complete_barcode)
-                            else:
-                                if self.debug_mode:
-                                    print(f"DEBUG: Barcode rejected: '{self.barcode_buffer}'")
-                                self.scanned_item = f"Unknown barcode: {self.barcode_buffer}"
-                            self.barcode_buffer = ""
-                    # Handle ALL alphanumeric input (not just digits) for barcode scanning
-                    else:
-                        # Convert pygame key to character
-                        key_char = None
-                        if event.key >= pygame.K_0 and event.key <= pygame.K_9:
-                            key_char = str(event.key - pygame.K_0)
-                        elif event.key >= pygame.K_a and event.key <= pygame.K_z:
-                            key_char = chr(event.key)
-                        elif event.key >= pygame.K_KP0 and event.key <= pygame.K_KP9:
-                            key_char = str(event.key - pygame.K_KP0)
-                        
-                        if key_char:
-                            # Debug output
-                            if self.debug_mode:
-                                print(f"DEBUG: Key pressed: '{key_char}' (buffer: '{self.barcode_buffer}')")
-                            
-                            # Try barcode input first
-                            barcode = self.process_barcode_input(key_char)
-                            if barcode:
-                                if self.debug_mode:
-                                    print(f"DEBUG: Complete barcode detected: '{barcode}'")
-                                self.scan_item(barcode)
-                            elif key_char.isdigit():
-                                # For manual keyboard input, use as shortcut only for digits
-                                if self.debug_mode:
-                                    print(f"DEBUG: Using as keyboard shortcut: '{key_char}'")
-                                self.scan_item(key_char)
-                
-                elif self.state == PAYMENT_MODE:
-                    if event.key == pygame.K_p:  # BLUE button (K2) - advance payment
-                        self.advance_payment()
-                
-                elif self.state == TIMER_MODE:
-                    # Same barcode handling as retail mode
-                    if event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:  # Enter key (barcode completion)
-                        if self.barcode_buffer:
-                            complete_barcode = self.process_barcode_complete(self.barcode_buffer)
-                            if complete_barcode:
-                                self.scan_timer_item(complete_barcode)
-                            else:
-                                self.scanned_item = f"Unknown barcode: {self.barcode_buffer}"
-                            self.barcode_buffer = ""
-                    # Handle ALL alphanumeric input (not just digits) for barcode scanning
-                    else:
-                        # Convert pygame key to character
-                        key_char = None
-                        if event.key >= pygame.K_0 and event.key <= pygame.K_9:
-                            key_char = str(event.key - pygame.K_0)
-                        elif event.key >= pygame.K_a and event.key <= pygame.K_z:
-                            key_char = chr(event.key)
-                        elif event.key >= pygame.K_KP0 and event.key <= pygame.K_KP9:
-                            key_char = str(event.key - pygame.K_KP0)
-                        
-                        if key_char:
-                            # Try barcode input first
-                            barcode = self.process_barcode_input(key_char)
-                            if barcode:
-                                self.scan_timer_item(barcode)
-                            elif key_char.isdigit():
-                                # For manual keyboard input, use as shortcut only for digits
-                                self.scan_timer_item(key_char)
-                
-                elif self.state == PRODUCT_MANAGER:
-                    if event.key == pygame.K_e:  # Export to CSV
-                        self.export_products_csv()
-                        self.scanned_item = "Products exported to products.csv"
-                    elif event.key == pygame.K_i:  # Import from CSV
-                        if self.import_products_csv():
-                            self.scanned_item = "Products imported from products.csv"
-                        else:
-                            self.scanned_item = "Error importing products.csv"
-                
-                elif self.state == GAME_OVER:
-                    # RED button to return to menu
-                    if event.key == pygame.K_ESCAPE:  # RED button (K4) - Return to menu
-                        self.state = MENU
+                else:
+                    # Keys with a fixed action in this state are one table lookup
+                    handler = self._keymaps[self.state].get(event.key)
+                    if handler:
+                        handler()
+                    
+                    elif self.state == RETAIL_MODE:
+                        self._handle_barcode_key(event, self.scan_item)
+                    
+                    elif self.state == TIMER_MODE:
+                        # Same barcode handling as retail mode
+                        self._handle_barcode_key(event, self.scan_timer_item)
             
             # Handle joystick button events
             elif event.type == pygame.JOYBUTTONDOWN:
                 if self.joystick:
                     button_num = event.button
-                    button_color = self.joystick_button_mapping.get(button_num, 'unknown')
                     
-                    if self.debug_mode:
-                        print(f"DEBUG: Joystick button {button_num} pressed ({button_color})")
+                    log.debug("Joystick button %s pressed (%s)", button_num,
+                              self.joystick_button_mapping.get(button_num, 'unknown'))
                     
                     # Shutdown combo is handled by continuous checking in main loop
                     # Just process normal button actions for red/player1 buttons
-                    
-                    # Handle button actions based on color and current state
-                    if self.state == MENU:
-                        if button_color == 'green':  # K1 - Self-checkout (Start/Go action)
-                            self.start_retail_mode()
-                        elif button_color == 'blue':  # K2 - Learning mode (Educational action)
-                            self.start_timer_mode()
-                        elif button_color == 'yellow':  # K3 - Product manager (Management action)
-                            self.state = PRODUCT_MANAGER
-                        elif button_color == 'red':  # K4 - Quit game (Stop/Exit action)
-                            self.running = False
-                    
-                    elif self.state == RETAIL_MODE:
-                        if button_color == 'green':  # K1 - Checkout (go/start action)
-                            self.start_payment()
-                        elif button_color == 'blue':  # K2 - Remove last item (undo action)
-                            self.remove_last_item()
-                        elif button_color == 'yellow':  # K3 - Clear cart (utility action)
-                            self.clear_cart()
-                        elif button_color == 'red':  # K4 - Home/Exit (stop action)
-                            self.state = MENU
-                    
-                    elif self.state == PAYMENT_MODE:
-                        if button_color == 'blue':  # K2 - Advance payment (primary action)
-                            self.advance_payment()
-                        elif button_color == 'red':  # K4 - Cancel payment (stop action)
-                            self.state = RETAIL_MODE
-                    
-                    elif self.state == TIMER_MODE:
-                        if button_color == 'red':  # K4 - Exit to menu (stop action)
-                            self.state = MENU
-                    
-                    elif self.state == PRODUCT_MANAGER:
-                        if button_color == 'red':  # K4 - Exit to menu (stop action)
-                            self.state = MENU
-                    
-                    elif self.state == GAME_OVER:
-                        if button_color == 'red':  # K4 - Return to menu (stop action)
-                            self.state = MENU
+                    handler = self._joy_keymaps[self.state].get(button_num)
+                    if handler:
+                        handler()
+    
+    def _build_keymaps(self):
+        """Map keys and arcade buttons to their action in each state"""
+        self._keymaps = {
+            MENU: {
+                # Keyboard controls for testing (hidden from UI)
+                pygame.K_1: self.start_retail_mode,
+                pygame.K_2: self.start_timer_mode,
+                pygame.K_3: self.open_product_manager,
+                pygame.K_q: self.quit_game,
+                # Arcade colored buttons for actual game
+                pygame.K_x: self.start_retail_mode,     # GREEN button (K1) - Self-checkout
+                pygame.K_p: self.start_timer_mode,      # BLUE button (K2) - Learning mode
+                pygame.K_c: self.open_product_manager,  # YELLOW button (K3) - Product manager
+            },
+            RETAIL_MODE: {
+                pygame.K_x: self.start_payment,     # GREEN button (K1) - Checkout
+                pygame.K_p: self.remove_last_item,  # BLUE button (K2) - Remove last item
+                pygame.K_c: self.clear_cart,        # YELLOW button (K3) - Clear cart
+                pygame.K_r: self.print_receipt,     # Print receipt (keyboard only)
+                pygame.K_UP: self.scroll_cart_up,
+                pygame.K_DOWN: self.scroll_cart_down,
+            },
+            PAYMENT_MODE: {
+                pygame.K_p: self.advance_payment,  # BLUE button (K2) - advance payment
+            },
+            TIMER_MODE: {},
+            PRODUCT_MANAGER: {
+                pygame.K_e: self.export_products,  # Export to CSV
+                pygame.K_i: self.import_products,  # Import from CSV
+            },
+            GAME_OVER: {},  # RED button (ESC) returns to menu in every state
+        }
+        color_actions = {
+            MENU: {
+                'green': self.start_retail_mode,      # K1 - Self-checkout (Start/Go action)
+                'blue': self.start_timer_mode,        # K2 - Learning mode (Educational action)
+                'yellow': self.open_product_manager,  # K3 - Product manager (Management action)
+                'red': self.quit_game,                # K4 - Quit game (Stop/Exit action)
+            },
+            RETAIL_MODE: {
+                'green': self.start_payment,     # K1 - Checkout (go/start action)
+                'blue': self.remove_last_item,   # K2 - Remove last item (undo action)
+                'yellow': self.clear_cart,       # K3 - Clear cart (utility action)
+                'red': self.return_to_menu,      # K4 - Home/Exit (stop action)
+            },
+            PAYMENT_MODE: {
+                'blue': self.advance_payment,  # K2 - Advance payment (primary action)
+                'red': self.cancel_payment,    # K4 - Cancel payment (stop action)
+            },
+            TIMER_MODE: {'red': self.return_to_menu},       # K4 - Exit to menu (stop action)
+            PRODUCT_MANAGER: {'red': self.return_to_menu},  # K4 - Exit to menu (stop action)
+            GAME_OVER: {'red': self.return_to_menu},        # K4 - Return to menu (stop action)
+        }
+        
+        # Resolve colors to button numbers so a button event is one dict lookup
+        self._joy_keymaps = {
+            state: {button: actions[color] for button, color in self.joystick_button_mapping.items() if color in actions}
+            for state, actions in color_actions.items()
+        }
+    
+    def _handle_enter(self, scan_fn):
+        """Complete the buffered barcode on Enter and scan it with scan_fn"""
+        if not self.barcode_buffer:
+            return
+        log.debug("Enter pressed, processing barcode: '%s'", self.barcode_buffer)
+        complete_barcode = self.process_barcode_complete(self.barcode_buffer)
+        if complete_barcode:
+            log.debug("Barcode accepted: '%s'", complete_barcode)
+            scan_fn(complete_barcode)
+        else:
+            log.debug("Barcode rejected: '%s'", self.barcode_buffer)
+            self.scanned_item = "Unknown barcode: " + self.barcode_buffer
+        self.barcode_buffer = ""
+    
+    def _handle_barcode_key(self, event, scan_fn):
+        """Feed a keypress to the barcode buffer and scan with scan_fn"""
+        if event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:  # Enter key (barcode completion)
+            self._handle_enter(scan_fn)
+            return
+        
+        # Handle ALL alphanumeric input (not just digits) for barcode scanning
+        key_char = self._key_to_char.get(event.key)
+        if key_char:
+            log.debug("Key pressed: '%s' (buffer: '%s')", key_char, self.barcode_buffer)
             
-            # Handle joystick button release events
-            elif event.type == pygame.JOYBUTTONUP:
-                if self.joystick:
-                    button_num = event.button
-                    button_color = self.joystick_button_mapping.get(button_num, 'unknown')
-                    
-                    # Reset shutdown combo if either button is released
-                    if button_color in ['red', 'player1']:
-                        self.shutdown_combo_start_time = None
-                        self.shutdown_combo_active = False
+            # Try barcode input first
+            barcode = self.process_barcode_input(key_char)
+            if barcode:
+                log.debug("Complete barcode detected: '%s'", barcode)
+                scan_fn(barcode)
+            elif key_char.isdigit():
+                # For manual keyboard input, use as shortcut only for digits
+                log.debug("Using as keyboard shortcut: '%s'", key_char)
+                scan_fn(key_char)
     
     def check_shutdown_combo(self):
         """Check if both red and player1 buttons are currently pressed"""
@@ -843,8 +1161,7 @@ class ArcadeRetailGame:
                 # Start the combo timer
                 self.shutdown_combo_start_time = current_time
                 self.shutdown_combo_active = True
-                if self.debug_mode:
-                    print("DEBUG: Shutdown combo started - hold for 3 seconds")
+                log.debug("Shutdown combo started - hold for 3 seconds")
             else:
                 # Check if held long enough
                 hold_time = (current_time - self.shutdown_combo_start_time) / 1000.0
@@ -861,27 +1178,17 @@ class ArcadeRetailGame:
         
         # Save any important data
         self.save_products(self.products_data)
+        self._receipt_writer.shutdown(wait=True)
         
         # Close serial connection
-        if hasattr(self, 'serial_scanner') and self.serial_scanner:
+        if self.serial_scanner is not None:
             self.serial_scanner.close()
         
         # Close pygame
         pygame.quit()
         
-        # Import subprocess here to avoid import at module level
-        import subprocess
-        import sys
-        
         # Try multiple shutdown methods
-        shutdown_commands = [
-            ['sudo', 'shutdown', '-h', 'now'],
-            ['sudo', 'poweroff'],
-            ['sudo', '/sbin/shutdown', '-h', 'now'],
-            ['sudo', '/sbin/poweroff']
-        ]
-        
-        for cmd in shutdown_commands:
+        for cmd in SHUTDOWN_COMMANDS:
             try:
                 print(f"Trying shutdown command: {' '.join(cmd)}")
                 subprocess.run(cmd, check=True, timeout=5)
@@ -912,17 +1219,62 @@ class ArcadeRetailGame:
             self.height = WINDOWED_HEIGHT
             self.desktop_mode = True
         
-        # Recreate fonts for new screen size
-        self.font_huge = pygame.font.Font(None, int(self.height * 0.12))
-        self.font_large = pygame.font.Font(None, int(self.height * 0.08))
-        self.font_medium = pygame.font.Font(None, int(self.height * 0.05))
-        self.font_small = pygame.font.Font(None, int(self.height * 0.035))
+        # Font sizes follow self.height automatically; fonts for the old size
+        # stay in self._fonts for when we toggle back. Cached text was
+        # converted for the old screen, so drop it.
+        self._text_cache.clear()
+        self._chrome_cache.clear()
+        self._image_frames.clear()
+        self.reset_field_caches()
+        self.map_colors()
+        self.compute_layout()
+        self._build_menu_bg()
+        self._build_retail_buttons()
+        self.warm_text()
+    
+    def quit_game(self):
+        """Leave the main loop"""
+        self.running = False
+    
+    def return_to_menu(self):
+        """Go back to the main menu"""
+        self.state = MENU
+    
+    def open_product_manager(self):
+        """Show the product manager screen"""
+        self.state = PRODUCT_MANAGER
+    
+    def cancel_payment(self):
+        """Abort payment and go back to the cart"""
+        self.state = RETAIL_MODE
+    
+    def scroll_cart_up(self):
+        """Scroll the cart list up one line"""
+        if self.cart_scroll_offset > 0:
+            self.cart_scroll_offset -= 1
+    
+    def scroll_cart_down(self):
+        """Scroll the cart list down one line"""
+        # Dynamic scrolling based on cart size
+        if self.cart_scroll_offset < self._max_scroll:
+            self.cart_scroll_offset += 1
+    
+    def export_products(self):
+        """Export products to CSV and report it"""
+        self.export_products_csv()
+        self.scanned_item = "Products exported to products.csv"
+    
+    def import_products(self):
+        """Import products from CSV and report the result"""
+        if self.import_products_csv():
+            self.scanned_item = "Products imported from products.csv"
+        else:
+            self.scanned_item = "Error importing products.csv"
     
     def start_retail_mode(self):
         """Initialize retail mode"""
         self.state = RETAIL_MODE
-        self.cart = {}
-        self.total_price = 0.0
+        self.reset_cart()
         self.scanned_item = ""
         self.receipt = []
         self.barcode_buffer = ""
@@ -932,12 +1284,12 @@ class ArcadeRetailGame:
     
     def start_payment(self):
         """Start payment process"""
-        if not self.cart:
+        if not self.cart_skus:
             self.scanned_item = "Cart is empty!"
             return
         
         self.state = PAYMENT_MODE
-        self.payment_amount = self.total_price
+        self.payment_cents = self.total_cents
         self.payment_step = 0
         self.payment_start_time = pygame.time.get_ticks()
     
@@ -946,13 +1298,23 @@ class ArcadeRetailGame:
         self.payment_step += 1
         if self.payment_step >= 4:
             # Complete payment
-            receipt = self.generate_receipt()
-            with open(f"receipt_{int(time.time())}.txt", "w") as f:
-                f.write("\n".join(receipt))
+            receipt_text = "\n".join(self.generate_receipt())
+            path = f"receipt_{int(time.time())}_{self._receipt_counter}.txt"
+            self._receipt_counter += 1
+            self._receipt_writer.submit(self._write_receipt, path, receipt_text)
             self.clear_cart()
             self.state = RETAIL_MODE
             self.scanned_item = "Payment complete! Thank you!"
     
+    @staticmethod
+    def _write_receipt(path, text):
+        """Write one receipt file (runs on the receipt writer thread)"""
+        try:
+            with open(path, "w") as f:
+                f.write(text)
+        except OSError as e:
+            print(f"Could not save receipt {path}: {e}")
+    
     def start_timer_mode(self):
         """Initialize learning mode with randomized product order"""
         self.state = TIMER_MODE
@@ -969,9 +1331,8 @@ class ArcadeRetailGame:
         self.last_key_time = 0
         
         # Randomize product order for different experience each time
-        all_items = list(self.skus.values())
-        random.shuffle(all_items)
-        self.learning_product_order = all_items
+        self.learning_product_order = random.sample(self._products, len(self._products))
+        self.learning_total = len(self.learning_product_order)
         
         self.generate_new_target()
     
@@ -986,9 +1347,7 @@ class ArcadeRetailGame:
         product = self.lookup_product(barcode_or_key)
         if product:
             # Use the actual SKU for cart item
-            sku = barcode_or_key
-            if barcode_or_key in self.keyboard_shortcuts:
-                sku = self.keyboard_shortcuts[barcode_or_key]
+            sku = self._shortcut_to_sku.get(barcode_or_key, barcode_or_key)
             
             self.scanned_item = self.add_to_cart(product, sku)
         else:
@@ -996,26 +1355,23 @@ class ArcadeRetailGame:
     
     def scan_timer_item(self, barcode_or_key):
         """Process scanned item in learning mode - move to next product on wrong scans"""
-        if self.debug_mode:
-            print(f"DEBUG: Learning mode scan attempt: '{barcode_or_key}', target: '{self.current_target['name'] if self.current_target else 'None'}'")
+        log.debug("Learning mode scan attempt: '%s', target: '%s'", barcode_or_key,
+                  self.current_target['name'] if self.current_target else None)
         
         if not self.current_target:
-            if self.debug_mode:
-                print("DEBUG: No current target in learning mode")
+            log.debug("No current target in learning mode")
             return
         
         # Apply scan cooldown like retail mode
         current_time = pygame.time.get_ticks()
         if current_time - self.last_scan_time < self.scan_cooldown:
-            if self.debug_mode:
-                print(f"DEBUG: Scan cooldown active, {current_time - self.last_scan_time}ms since last scan")
+            log.debug("Scan cooldown active, %sms since last scan", current_time - self.last_scan_time)
             return
         
         self.last_scan_time = current_time
         
         product = self.lookup_product(barcode_or_key)
-        if self.debug_mode:
-            print(f"DEBUG: Product lookup result: {product['name'] if product else 'None'}")
+        log.debug("Product lookup result: %s", product['name'] if product else None)
         
         if product:
             if product['name'] == self.current_target['name']:
@@ -1024,20 +1380,17 @@ class ArcadeRetailGame:
                 self.timer_score += 1
                 self.timer_items_found.append(product['name'])
                 self.scanned_item = f"✓ Correct! That's {product['name']}!"
-                if self.debug_mode:
-                    print(f"DEBUG: CORRECT! Score now: {self.timer_correct}")
+                log.debug("CORRECT! Score now: %s", self.timer_correct)
                 self.generate_new_target()
             else:
                 # Wrong item - move to next product automatically
                 self.scanned_item = f"That's {product['name']}. Moving to next product!"
-                if self.debug_mode:
-                    print(f"DEBUG: Wrong item: got '{product['name']}', expected '{self.current_target['name']}'")
+                log.debug("Wrong item: got '%s', expected '%s'", product['name'], self.current_target['name'])
                 self.generate_new_target()
         else:
             # Invalid barcode - move to next product
             self.scanned_item = f"Product not found. Moving to next product!"
-            if self.debug_mode:
-                print(f"DEBUG: Product not found for: '{barcode_or_key}'")
+            log.debug("Product not found for: '%s'", barcode_or_key)
             self.generate_new_target()
     
     def generate_new_target(self):
@@ -1051,7 +1404,7 @@ class ArcadeRetailGame:
     
     def print_receipt(self):
         """Print current receipt"""
-        if self.cart:
+        if self.cart_skus:
             receipt = self.generate_receipt()
             print("\n".join(receipt))
             self.scanned_item = "Receipt printed to console"
@@ -1060,66 +1413,106 @@ class ArcadeRetailGame:
     
     def clear_cart(self):
         """Clear the shopping cart"""
-        self.cart = {}
-        self.total_price = 0.0
+        self.reset_cart()
         self.receipt = []
         self.cart_scroll_offset = 0
         self.scanned_item = "Cart cleared!"
     
     def remove_last_item(self):
         """Remove the last added item from cart"""
-        if not self.cart:
+        if not self.cart_skus:
             self.scanned_item = "Cart is empty!"
             return
         
-        # Find the most recently added item
-        last_item_sku = None
-        last_time = 0
-        
-        for sku, item in self.cart.items():
-            if item['first_added'] > last_time:
-                last_time = item['first_added']
-                last_item_sku = sku
-        
-        if last_item_sku:
-            item = self.cart[last_item_sku]
+        # Cart lines are kept in first-added order, so the most recently
+        # added item is always the last line
+        index = len(self.cart_skus) - 1
+        name = self.cart_names[index]
+        self.total_cents -= self.cart_price_cents[index]
+        self._receipt_body = None
+        
+        # Remove one quantity
+        if self.cart_qty[index] > 1:
+            self.cart_qty[index] -= 1
+            self.cart_qty_strs[index] = f"x{self.cart_qty[index]}"
+            self.scanned_item = f"Removed one {name} [Qty: {self.cart_qty[index]}]"
+        else:
+            # Remove item completely
+            del self._sku_index[self.cart_skus.pop()]
+            self.cart_names.pop()
+            self.cart_qty.pop()
+            self.cart_price_cents.pop()
+            self.cart_price_strs.pop()
+            self.cart_qty_strs.pop()
+            self.scanned_item = f"Removed {name} from cart"
             
-            # Remove one quantity
-            if item['quantity'] > 1:
-                item['quantity'] -= 1
-                item['total_price'] -= item['price']
-                self.total_price -= item['price']
-                self.scanned_item = f"Removed one {item['name']} [Qty: {item['quantity']}]"
-            else:
-                # Remove item completely
-                self.total_price -= item['price']
-                removed_name = item['name']
-                del self.cart[last_item_sku]
-                self.scanned_item = f"Removed {removed_name} from cart"
-                
-                            # Adjust scroll if needed
-                total_items = len(self.cart)
-                max_displayable = 4 if total_items <= 4 else 8
-                if self.cart_scroll_offset > 0 and total_items <= max_displayable:
-                    self.cart_scroll_offset = 0
+            # Adjust scroll if needed - one line fewer can also lower the limit
+            self._compute_visible()
+            self.cart_scroll_offset = min(self.cart_scroll_offset, self._max_scroll)
     
     def draw_menu(self):
         """Draw the main menu with storefront banner"""
-        self.screen.fill(BLACK)
+        # Nothing on the menu changes between frames
+        self.screen.blit(self._menu_bg, (0, 0))
+    
+    def _chrome(self, key, build):
+        """Return the cached static background for a screen, drawing it with build(surface) on first use"""
+        surface = self._chrome_cache.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.width, self.height)).convert()
+            surface.fill(BLACK)
+            build(surface)
+            self._chrome_cache[key] = surface
+        return surface
+    
+    def warm_text(self):
+        """Render the fixed labels of every screen into the text cache so entering a screen doesn't wait on fonts"""
+        labels = [
+            # Payment steps
+            (self.font_large, "PAYMENT", GREEN),
+            (self.font_medium, "PAY NOW", BLACK),
+            (self.font_medium, "CANCEL", BLACK),
+            (self.font_large, "Processing Payment...", YELLOW),
+            (self.font_medium, "CONTINUE", BLACK),
+            (self.font_large, "PAYMENT SUCCESSFUL!", GREEN),
+            (self.font_medium, "GET RECEIPT", BLACK),
+            (self.font_large, "THANK YOU!", BRIGHT_GREEN),
+            (self.font_medium, "Receipt saved", WHITE),
+            (self.font_medium, "CONTINUE SHOPPING", BLACK),
+            # Learning mode and game over
+            (self.font_large, "ASTRID MART - LEARNING MODE", ORANGE),
+            (self.font_large, "SCAN THIS PRODUCT:", PURPLE),
+            (self.font_small, "RED BUTTON = EXIT", BLACK),
+            (self.font_huge, "LEARNING COMPLETE!", BRIGHT_GREEN),
+            (self.font_large, "Your Score:", WHITE),
+            (self.font_medium, "Press     button to continue", WHITE),
+            # Product manager
+            (self.font_large, "PRODUCT MANAGER", PURPLE),
+            (self.font_small, "CSV Format Example:", YELLOW),
+        ]
+        labels += [(self.font_medium, instruction, CYAN) for instruction in MANAGER_INSTRUCTIONS]
+        labels += [(self.font_small, line, WHITE) for line in CSV_EXAMPLE_LINES]
+        for font, text, color in labels:
+            self._text(font, text, color)
+    
+    def _build_menu_bg(self):
+        """Pre-render the static menu (banner, options, instructions) into one surface"""
+        surface = pygame.Surface((self.width, self.height)).convert()
+        surface.fill(BLACK)
         
         # Display storefront banner at top of screen
         banner_height = 0
         if self.storefront_banner:
             # Draw banner at full width against top edge
-            self.screen.blit(self.storefront_banner, (0, 0))
+            surface.blit(self.storefront_banner, (0, 0))
             banner_height = self.storefront_banner.get_height()
         
         # Add tagline below banner - responsive spacing
         tagline_spacing = self.scale(20)
         tagline_y = banner_height + tagline_spacing if banner_height > 0 else self.height * 0.25
-        tagline = self.font_medium.render("~ Kids' Shopping Adventure ~", True, WHITE)
+        tagline = self._text(self.font_medium, "~ Kids' Shopping Adventure ~", WHITE)
         tagline_rect = tagline.get_rect(center=(self.width//2, tagline_y))
-        self.screen.blit(tagline, tagline_rect)
+        surface.blit(tagline, tagline_rect)
         
         # Menu options with more intuitive colored buttons
         options = [
@@ -1136,7 +1529,7 @@ class ArcadeRetailGame:
             option_y = start_y + i * self.height * 0.08
             
             # White text for readability
-            option_text = self.font_medium.render(text, True, WHITE)
+            option_text = self._text(self.font_medium, text, WHITE)
             option_rect = option_text.get_rect(center=(self.width//2, option_y))
             
             # Option background box with colored border - responsive padding
@@ -1144,17 +1537,17 @@ class ArcadeRetailGame:
             bg_padding_y = self.scale(10)
             option_bg = pygame.Rect(option_rect.x - bg_padding_x, option_rect.y - bg_padding_y, 
                                   option_rect.width + 2*bg_padding_x, option_rect.height + 2*bg_padding_y)
-            self.draw_border_box(option_bg, color, 3)  # Colored border
+            self.draw_border_box(option_bg, color, 3, surface)  # Colored border
             
             # Draw colored circle AFTER text, positioned to the right - responsive positioning
             circle_offset = self.scale(30)
             circle_radius = self.scale(18)
             circle_x = option_bg.right + circle_offset
             circle_y = option_y
-            pygame.draw.circle(self.screen, color, (circle_x, circle_y), circle_radius)
-            pygame.draw.circle(self.screen, BLACK, (circle_x, circle_y), circle_radius, 3)  # Black border
+            pygame.draw.circle(surface, color, (circle_x, circle_y), circle_radius)
+            pygame.draw.circle(surface, BLACK, (circle_x, circle_y), circle_radius, 3)  # Black border
             
-            self.screen.blit(option_text, option_rect)
+            surface.blit(option_text, option_rect)
         
         # Instructions at bottom - positioned well below menu buttons - responsive spacing
         instructions = [
@@ -1168,64 +1561,108 @@ class ArcadeRetailGame:
         instructions_start_y = max(last_button_y + button_padding, self.height * 0.88)
         
         for i, instruction in enumerate(instructions):
-            text = self.font_small.render(instruction, True, CYAN)
+            text = self._text(self.font_small, instruction, CYAN)
             text_rect = text.get_rect(center=(self.width//2, instructions_start_y + i * self.height * 0.025))
-            self.screen.blit(text, text_rect)
+            surface.blit(text, text_rect)
+        
+        self._menu_bg = surface
+    
+    def _build_retail_buttons(self):
+        """Pre-render the retail screen's row of arcade buttons into one strip"""
+        button_width = self.width * 0.22  # Slightly wider buttons
+        button_height = self.height * 0.1
+        surface = pygame.Surface((self.width, int(button_height))).convert()
+        surface.fill(BLACK)
+        
+        # 4 essential buttons - just the action text
+        buttons = [
+            ("CHECKOUT", BRIGHT_GREEN),
+            ("REMOVE", BLUE), 
+            ("CLEAR ALL", YELLOW),
+            ("HOME", RED)
+        ]
+        
+        # Center the buttons - responsive spacing
+        button_spacing = self.scale(20)  # Responsive spacing between buttons
+        total_buttons_width = len(buttons) * button_width + (len(buttons) - 1) * button_spacing
+        start_x = (self.width - total_buttons_width) // 2
+        
+        for i, (action, color) in enumerate(buttons):
+            button_x = start_x + (i * (button_width + button_spacing))
+            
+            # Clean button design with subtle border
+            button_rect = pygame.Rect(button_x, 0, button_width, button_height)
+            pygame.draw.rect(surface, color, button_rect)
+            pygame.draw.rect(surface, BLACK, button_rect, 3)
+            
+            # Bold action text - properly sized and centered
+            # Use medium font to ensure text fits
+            action_text = self._text(self.font_medium, action, BLACK)
+            action_rect = action_text.get_rect(center=button_rect.center)
+            
+            # Only add outline if text is short enough - responsive padding
+            if action_text.get_width() < button_width - self.scale(20):
+                # Add subtle shadow for readability
+                shadow_text = self._text(self.font_medium, action, WHITE)
+                shadow_rect = shadow_text.get_rect(center=(button_rect.centerx + 1, button_rect.centery + 1))
+                surface.blit(shadow_text, shadow_rect)
+            
+            surface.blit(action_text, action_rect)
+        
+        self._retail_buttons = surface
     
     def draw_retail_mode(self):
         """Draw self-checkout mode screen - Clean and simple for kids"""
         self.screen.fill(BLACK)
         
         # Simple title
-        title = self.font_large.render("ASTRID MART - CHECKOUT", True, BRIGHT_GREEN)
+        title = self._text(self.font_large, "ASTRID MART - CHECKOUT", BRIGHT_GREEN)
         title_rect = title.get_rect(center=(self.width//2, self.height * 0.05))
         self.screen.blit(title, title_rect)
         
         # Cart items display area - Clean, no borders
-        cart_area = pygame.Rect(self.width * 0.05, self.height * 0.12, 
-                               self.width * 0.9, self.height * 0.4)
+        cart_area = self._layout.cart_area
         
         # Display cart items - Smart layout supporting up to 8 items
-        if self.cart:
-            items = list(self.cart.values())
-            items.sort(key=lambda x: x['first_added'])
-            
+        if self.cart_skus:
             # Smart layout: 1 column for 1-4 items, 2 columns for 5-8 items
-            total_items = len(items)
+            total_items = len(self.cart_skus)
+            blits = []
+            qty_badges = []
             
             if total_items <= 4:
                 # Single column layout for 1-4 items - responsive spacing
-                visible_items = min(4, total_items)
+                visible_items = self._visible_n
                 start_idx = self.cart_scroll_offset
                 end_idx = min(start_idx + visible_items, total_items)
-                visible_items_list = items[start_idx:end_idx]
+                visible_items_list = range(start_idx, end_idx)
                 
-                item_height = self.scale(95)  # Responsive item height
-                item_spacing = self.scale(105)  # Responsive spacing between items
+                item_height = self._layout.cart_item_height  # Responsive item height
+                item_spacing = self._layout.cart_item_spacing  # Responsive spacing between items
                 
-                for i, item in enumerate(visible_items_list):
+                for i, index in enumerate(visible_items_list):
                     item_y = cart_area.y + (i * item_spacing)
                     
                     # Clean item background - no borders
                     item_bg = pygame.Rect(cart_area.x, item_y, cart_area.width, item_height)
-                    pygame.draw.rect(self.screen, (30, 30, 30), item_bg)
+                    self.screen.fill(self._mapped[CART_ROW_BG], item_bg)
                     
-                    self.draw_cart_item(item, item_bg, cart_area)
+                    self.draw_cart_item(index, item_bg, cart_area, blits, qty_badges)
             
             else:
                 # Two column layout for 5-8 items - responsive dimensions
-                visible_items = min(8, total_items)
+                visible_items = self._visible_n
                 start_idx = self.cart_scroll_offset
                 end_idx = min(start_idx + visible_items, total_items)
-                visible_items_list = items[start_idx:end_idx]
+                visible_items_list = range(start_idx, end_idx)
                 
                 # Calculate column dimensions - responsive gap
-                col_gap = self.scale(20)  # Responsive gap between columns
+                col_gap = self._layout.col_gap  # Responsive gap between columns
                 col_width = (cart_area.width - col_gap) // 2
-                col_height = self.scale(90)  # Responsive height for prominent images
-                row_spacing = self.scale(100)  # Responsive spacing between rows
+                col_height = self._layout.col_height  # Responsive height for prominent images
+                row_spacing = self._layout.row_spacing  # Responsive spacing between rows
                 
-                for i, item in enumerate(visible_items_list):
+                for i, index in enumerate(visible_items_list):
                     row = i // 2
                     col = i % 2
                     
@@ -1234,25 +1671,30 @@ class ArcadeRetailGame:
                     
                     # Clean item background - no borders
                     item_bg = pygame.Rect(item_x, item_y, col_width, col_height)
-                    pygame.draw.rect(self.screen, (30, 30, 30), item_bg)
+                    self.screen.fill(self._mapped[CART_ROW_BG], item_bg)
                     
-                    self.draw_cart_item(item, item_bg, cart_area, is_compact=True)
+                    self.draw_cart_item(index, item_bg, cart_area, blits, qty_badges, is_compact=True)
+            
+            # Images, names and prices for every visible row in one call
+            self.blit_all(blits)
+            for qty_bg, qty_text, qty_rect in qty_badges:
+                pygame.draw.rect(self.screen, self._mapped[HOT_PINK], qty_bg)
+                self.screen.blit(qty_text, qty_rect)
             
             # Simple scroll indicators - only show if needed
-            max_displayable = 4 if total_items <= 4 else 8
-            if total_items > max_displayable:
+            if self._max_scroll:
                 if self.cart_scroll_offset > 0:
-                    up_text = self.font_large.render("▲", True, BRIGHT_GREEN)
+                    up_text = self._text(self.font_large, "▲", BRIGHT_GREEN)
                     up_rect = up_text.get_rect(center=(cart_area.right - 30, cart_area.y + 20))
                     self.screen.blit(up_text, up_rect)
                 
-                if self.cart_scroll_offset < total_items - max_displayable:
-                    down_text = self.font_large.render("▼", True, BRIGHT_GREEN)
+                if self.cart_scroll_offset < self._max_scroll:
+                    down_text = self._text(self.font_large, "▼", BRIGHT_GREEN)
                     down_rect = down_text.get_rect(center=(cart_area.right - 30, cart_area.bottom - 20))
                     self.screen.blit(down_text, down_rect)
         else:
             # Simple empty cart message
-            empty_text = self.font_large.render("Cart is empty - scan an item!", True, WHITE)
+            empty_text = self._text(self.font_large, "Cart is empty - scan an item!", WHITE)
             empty_rect = empty_text.get_rect(center=(cart_area.centerx, cart_area.centery))
             self.screen.blit(empty_text, empty_rect)
         
@@ -1260,7 +1702,10 @@ class ArcadeRetailGame:
         total_y = cart_area.bottom + 80
         
         # Total price - HUGE and clean
-        total_price_text = self.font_huge.render(f"TOTAL: €{self.total_price:.2f}", True, YELLOW)
+        if self._total_cache[0] != self.total_cents:
+            surface = self._text(self.font_huge, f"TOTAL: {format_cents(self.total_cents)}", YELLOW)
+            self._total_cache = (self.total_cents, surface)
+        total_price_text = self._total_cache[1]
         total_price_rect = total_price_text.get_rect(center=(self.width//2, total_y))
         # Simple background
         total_bg = pygame.Rect(total_price_rect.x - 20, total_price_rect.y - 10, 
@@ -1268,335 +1713,323 @@ class ArcadeRetailGame:
         pygame.draw.rect(self.screen, (40, 40, 0), total_bg)
         self.screen.blit(total_price_text, total_price_rect)
         
-        # 4 ARCADE BUTTONS - Clean and simple
+        # 4 ARCADE BUTTONS - pre-rendered, only their height depends on the total
         button_y = total_price_rect.bottom + 50
-        button_width = self.width * 0.22  # Slightly wider buttons
         button_height = self.height * 0.1
-        
-        # 4 essential buttons - just the action text
-        buttons = [
-            ("CHECKOUT", BRIGHT_GREEN),
-            ("REMOVE", BLUE), 
-            ("CLEAR ALL", YELLOW),
-            ("HOME", RED)
-        ]
-        
-        # Center the buttons - responsive spacing
-        button_spacing = self.scale(20)  # Responsive spacing between buttons
-        total_buttons_width = len(buttons) * button_width + (len(buttons) - 1) * button_spacing
-        start_x = (self.width - total_buttons_width) // 2
-        
-        for i, (action, color) in enumerate(buttons):
-            button_x = start_x + (i * (button_width + button_spacing))
-            
-            # Clean button design with subtle border
-            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-            pygame.draw.rect(self.screen, color, button_rect)
-            pygame.draw.rect(self.screen, BLACK, button_rect, 3)
-            
-            # Bold action text - properly sized and centered
-            # Use medium font to ensure text fits
-            action_text = self.font_medium.render(action, True, BLACK)
-            action_rect = action_text.get_rect(center=button_rect.center)
-            
-            # Only add outline if text is short enough - responsive padding
-            if action_text.get_width() < button_width - self.scale(20):
-                # Add subtle shadow for readability
-                shadow_text = self.font_medium.render(action, True, WHITE)
-                shadow_rect = shadow_text.get_rect(center=(button_rect.centerx + 1, button_rect.centery + 1))
-                self.screen.blit(shadow_text, shadow_rect)
-            
-            self.screen.blit(action_text, action_rect)
+        self.screen.blit(self._retail_buttons, (0, button_y))
         
         # Status message - Clean and simple - responsive spacing
         if self.scanned_item:
-            status_y = button_y + button_height + self.scale(30)
+            status_y = button_y + button_height + self._layout.status_gap
             
             # Clean scan feedback
-            message_text = self.font_medium.render(f"✓ {self.scanned_item}", True, BRIGHT_GREEN)
+            if self._message_cache[0] != self.scanned_item:
+                surface = self._text(self.font_medium, f"✓ {self.scanned_item}", BRIGHT_GREEN)
+                self._message_cache = (self.scanned_item, surface)
+            message_text = self._message_cache[1]
             message_rect = message_text.get_rect(center=(self.width//2, status_y))
             self.screen.blit(message_text, message_rect)
     
     def draw_payment_mode(self):
         """Draw payment process screen - clean button design"""
-        self.screen.fill(BLACK)
+        # Title, buttons and labels of each step never change
+        self.screen.blit(self._payment_chrome(self.payment_step), (0, 0))
         
-        # Title - responsive padding
-        title = self.font_large.render("PAYMENT", True, GREEN)
-        title_rect = title.get_rect(center=(self.width//2, self.height * 0.15))
-        title_bg = pygame.Rect(title_rect.x - self.scale(20), title_rect.y - self.scale(10), 
-                              title_rect.width + self.scale(40), title_rect.height + self.scale(20))
-        self.draw_border_box(title_bg, GREEN, 4)
-        self.screen.blit(title, title_rect)
-        
-        # Payment steps
         if self.payment_step == 0:
             # Show total amount
-            amount_text = self.font_huge.render(f"€{self.payment_amount:.2f}", True, YELLOW)
+            if self._amount_cache[0] != self.payment_cents:
+                surface = self._text(self.font_huge, format_cents(self.payment_cents), YELLOW)
+                self._amount_cache = (self.payment_cents, surface)
+            amount_text = self._amount_cache[1]
             amount_rect = amount_text.get_rect(center=(self.width//2, self.height * 0.4))
             self.screen.blit(amount_text, amount_rect)
-            
+        
+        elif self.payment_step == 1:
+            # Animate dots - the only part that changes between frames
+            self.screen.blit(*self._payment_dots())
+            self._anim_rect = self._layout.payment_dots_band
+    
+    def _payment_chrome(self, step):
+        """Return the cached static background for one payment step"""
+        return self._chrome((PAYMENT_MODE, step), lambda surface: self._build_payment_chrome(surface, step))
+    
+    def _build_payment_chrome(self, surface, step):
+        """Draw the static parts of a payment step onto surface"""
+        blit_list = []  # Text goes on top of the boxes, in one call at the end
+        
+        # Title - responsive padding
+        layout = self._layout
+        title = self._text(self.font_large, "PAYMENT", GREEN)
+        self.draw_border_box(layout.payment_title_bg, GREEN, 4, surface)
+        blit_list.append((title, layout.payment_title))
+        
+        # Payment steps
+        if step == 0:
             # Clear buttons instead of confusing tiny circles
-            button_width = self.width * 0.3  # Responsive button width
-            button_height = self.height * 0.08  # Responsive button height
-            
             # BLUE button - Pay
-            pay_button_y = self.height * 0.6
-            pay_button_rect = pygame.Rect(self.width//2 - button_width//2, pay_button_y, button_width, button_height)
-            pygame.draw.rect(self.screen, BLUE, pay_button_rect)
-            pygame.draw.rect(self.screen, BLACK, pay_button_rect, 3)
+            pay_button_rect = layout.pay_button
+            pygame.draw.rect(surface, BLUE, pay_button_rect)
+            pygame.draw.rect(surface, BLACK, pay_button_rect, 3)
             
-            pay_text = self.font_medium.render("PAY NOW", True, BLACK)
+            pay_text = self._text(self.font_medium, "PAY NOW", BLACK)
             pay_text_rect = pay_text.get_rect(center=pay_button_rect.center)
-            self.screen.blit(pay_text, pay_text_rect)
+            blit_list.append((pay_text, pay_text_rect))
             
             # RED button - Cancel
-            cancel_button_y = self.height * 0.75
-            cancel_button_rect = pygame.Rect(self.width//2 - button_width//2, cancel_button_y, button_width, button_height)
-            pygame.draw.rect(self.screen, RED, cancel_button_rect)
-            pygame.draw.rect(self.screen, BLACK, cancel_button_rect, 3)
+            cancel_button_rect = layout.cancel_button
+            pygame.draw.rect(surface, RED, cancel_button_rect)
+            pygame.draw.rect(surface, BLACK, cancel_button_rect, 3)
             
-            cancel_text = self.font_medium.render("CANCEL", True, BLACK)
+            cancel_text = self._text(self.font_medium, "CANCEL", BLACK)
             cancel_text_rect = cancel_text.get_rect(center=cancel_button_rect.center)
-            self.screen.blit(cancel_text, cancel_text_rect)
+            blit_list.append((cancel_text, cancel_text_rect))
         
-        elif self.payment_step == 1:
+        elif step == 1:
             # Processing payment
-            processing_text = self.font_large.render("Processing Payment...", True, YELLOW)
+            processing_text = self._text(self.font_large, "Processing Payment...", YELLOW)
             processing_rect = processing_text.get_rect(center=(self.width//2, self.height * 0.4))
-            self.screen.blit(processing_text, processing_rect)
-            
-            # Animate dots
-            dots = "." * ((pygame.time.get_ticks() // 500) % 4)
-            dots_text = self.font_large.render(dots, True, YELLOW)
-            dots_rect = dots_text.get_rect(center=(self.width//2, self.height * 0.5))
-            self.screen.blit(dots_text, dots_rect)
+            blit_list.append((processing_text, processing_rect))
             
             # BLUE button - Continue
-            button_width = self.width * 0.3
-            button_height = self.height * 0.08
-            continue_button_y = self.height * 0.7
-            continue_button_rect = pygame.Rect(self.width//2 - button_width//2, continue_button_y, button_width, button_height)
-            pygame.draw.rect(self.screen, BLUE, continue_button_rect)
-            pygame.draw.rect(self.screen, BLACK, continue_button_rect, 3)
+            continue_button_rect = layout.continue_button
+            pygame.draw.rect(surface, BLUE, continue_button_rect)
+            pygame.draw.rect(surface, BLACK, continue_button_rect, 3)
             
-            continue_text = self.font_medium.render("CONTINUE", True, BLACK)
+            continue_text = self._text(self.font_medium, "CONTINUE", BLACK)
             continue_text_rect = continue_text.get_rect(center=continue_button_rect.center)
-            self.screen.blit(continue_text, continue_text_rect)
+            blit_list.append((continue_text, continue_text_rect))
         
-        elif self.payment_step == 2:
+        elif step == 2:
             # Payment successful
-            success_text = self.font_large.render("PAYMENT SUCCESSFUL!", True, GREEN)
+            success_text = self._text(self.font_large, "PAYMENT SUCCESSFUL!", GREEN)
             success_rect = success_text.get_rect(center=(self.width//2, self.height * 0.4))
-            self.screen.blit(success_text, success_rect)
+            blit_list.append((success_text, success_rect))
             
             # BLUE button - Get Receipt
-            button_width = self.width * 0.3
-            button_height = self.height * 0.08
-            receipt_button_y = self.height * 0.6
-            receipt_button_rect = pygame.Rect(self.width//2 - button_width//2, receipt_button_y, button_width, button_height)
-            pygame.draw.rect(self.screen, BLUE, receipt_button_rect)
-            pygame.draw.rect(self.screen, BLACK, receipt_button_rect, 3)
+            receipt_button_rect = layout.receipt_button
+            pygame.draw.rect(surface, BLUE, receipt_button_rect)
+            pygame.draw.rect(surface, BLACK, receipt_button_rect, 3)
             
-            receipt_text = self.font_medium.render("GET RECEIPT", True, BLACK)
+            receipt_text = self._text(self.font_medium, "GET RECEIPT", BLACK)
             receipt_text_rect = receipt_text.get_rect(center=receipt_button_rect.center)
-            self.screen.blit(receipt_text, receipt_text_rect)
+            blit_list.append((receipt_text, receipt_text_rect))
         
-        elif self.payment_step == 3:
+        elif step == 3:
             # Receipt and thank you
-            thank_you_text = self.font_large.render("THANK YOU!", True, BRIGHT_GREEN)
+            thank_you_text = self._text(self.font_large, "THANK YOU!", BRIGHT_GREEN)
             thank_you_rect = thank_you_text.get_rect(center=(self.width//2, self.height * 0.35))
-            self.screen.blit(thank_you_text, thank_you_rect)
+            blit_list.append((thank_you_text, thank_you_rect))
             
-            receipt_text = self.font_medium.render("Receipt saved", True, WHITE)
+            receipt_text = self._text(self.font_medium, "Receipt saved", WHITE)
             receipt_rect = receipt_text.get_rect(center=(self.width//2, self.height * 0.5))
-            self.screen.blit(receipt_text, receipt_rect)
+            blit_list.append((receipt_text, receipt_rect))
             
             # BLUE button - Continue Shopping
-            button_width = self.width * 0.35
-            button_height = self.height * 0.08
-            continue_button_y = self.height * 0.65
-            continue_button_rect = pygame.Rect(self.width//2 - button_width//2, continue_button_y, button_width, button_height)
-            pygame.draw.rect(self.screen, BLUE, continue_button_rect)
-            pygame.draw.rect(self.screen, BLACK, continue_button_rect, 3)
+            continue_button_rect = layout.continue_shopping_button
+            pygame.draw.rect(surface, BLUE, continue_button_rect)
+            pygame.draw.rect(surface, BLACK, continue_button_rect, 3)
             
-            continue_text = self.font_medium.render("CONTINUE SHOPPING", True, BLACK)
+            continue_text = self._text(self.font_medium, "CONTINUE SHOPPING", BLACK)
             continue_text_rect = continue_text.get_rect(center=continue_button_rect.center)
-            self.screen.blit(continue_text, continue_text_rect)
+            blit_list.append((continue_text, continue_text_rect))
+        
+        surface.blits(blit_list, doreturn=0)
     
     def draw_timer_mode(self):
         """Draw learning mode screen - clean, no borders, high quality images"""
-        self.screen.fill(BLACK)
+        # Check if all products have been shown
+        if not self.current_target:
+            self.state = GAME_OVER
+            self.draw_game_over()
+            return
         
-        # Title
-        title = self.font_large.render("ASTRID MART - LEARNING MODE", True, ORANGE)
-        title_rect = title.get_rect(center=(self.width//2, self.height * 0.05))
-        self.screen.blit(title, title_rect)
+        # Title, instruction and exit button never change
+        self.screen.blit(self._chrome(TIMER_MODE, self._build_timer_chrome), (0, 0))
         
         # Progress and score info - no timer!
         info_y = self.height * 0.12
         
-        all_items = len(self.learning_product_order) if hasattr(self, 'learning_product_order') else len(self.skus.values())
-        progress_text = self.font_medium.render(f"PRODUCT: {self.learning_current_index}/{all_items}", True, WHITE)
-        score_text = self.font_medium.render(f"CORRECT: {self.timer_correct}", True, BRIGHT_GREEN)
+        key = (self.learning_current_index, self.learning_total)
+        if self._progress_cache[0] != key:
+            surface = self._text(self.font_medium, f"PRODUCT: {key[0]}/{key[1]}", WHITE)
+            self._progress_cache = (key, surface)
+        progress_text = self._progress_cache[1]
+        
+        if self._score_cache[0] != self.timer_correct:
+            surface = self._text(self.font_medium, f"CORRECT: {self.timer_correct}", BRIGHT_GREEN)
+            self._score_cache = (self.timer_correct, surface)
+        score_text = self._score_cache[1]
         
         self.screen.blit(progress_text, (self.width * 0.2, info_y))
         self.screen.blit(score_text, (self.width * 0.6, info_y))
         
-        # Check if all products have been shown
-        if not self.current_target:
-            self.state = GAME_OVER
-            return
-        
         # Main product display area - clean and simple
         target_y = self.height * 0.25
         
-        # Instruction
-        find_text = self.font_large.render("SCAN THIS PRODUCT:", True, PURPLE)
-        find_rect = find_text.get_rect(center=(self.width//2, target_y))
-        self.screen.blit(find_text, find_rect)
-        
         # HUGE PRODUCT IMAGE - arcade style with original quality
-        image_y = target_y + self.scale(40)
+        image_y = target_y + self._layout.target_image_gap
         # Make image much bigger - use more screen space
         image_size = min(self.width * 0.4, self.height * 0.5)  # 40% of width or 50% of height, whichever is smaller
         image_rect = pygame.Rect(self.width//2 - image_size//2, image_y, image_size, image_size)
         
         # Get the SKU for this target to find its image
-        target_sku = None
-        for sku, product in self.skus.items():
-            if product['name'] == self.current_target['name']:
-                target_sku = sku
-                break
+        target_sku = self._name_to_sku.get(self.current_target['name'])
         
         if target_sku and target_sku in self.product_images:
             # Scale to huge size while preserving original quality
-            image = self.product_images[target_sku]
-            image_scaled = pygame.transform.scale(image, (int(image_size), int(image_size)))
+            image_scaled = self.get_scaled_image(target_sku, int(image_size))
             self.screen.blit(image_scaled, image_rect)
         else:
             # Fallback if no image - simple gray box
             pygame.draw.rect(self.screen, (50, 50, 50), image_rect)
-            no_image_text = self.font_medium.render("No Image", True, WHITE)
+            no_image_text = self._text(self.font_medium, "No Image", WHITE)
             no_image_rect = no_image_text.get_rect(center=image_rect.center)
             self.screen.blit(no_image_text, no_image_rect)
         
         # Product name below image - smaller font for better balance
-        name_y = image_rect.bottom + self.scale(25)
-        target_text = self.font_medium.render(self.current_target['name'], True, HOT_PINK)
+        name_y = image_rect.bottom + self._layout.target_name_gap
+        target_text = self._text(self.font_medium, self.current_target['name'], HOT_PINK)
         target_rect = target_text.get_rect(center=(self.width//2, name_y))
         self.screen.blit(target_text, target_rect)
         
         # Feedback message - positioned below product name
         if self.scanned_item:
-            feedback_y = name_y + self.scale(50)
+            feedback_y = name_y + self._layout.feedback_gap
             
             # Color based on message type
             feedback_color = BRIGHT_GREEN if "✓ Correct" in self.scanned_item else ORANGE
-            feedback_text = self.font_medium.render(self.scanned_item, True, feedback_color)
+            feedback_text = self._text(self.font_medium, self.scanned_item, feedback_color)
             feedback_rect = feedback_text.get_rect(center=(self.width//2, feedback_y))
             self.screen.blit(feedback_text, feedback_rect)
+    
+    def _build_timer_chrome(self, surface):
+        """Draw the static parts of the learning mode screen onto surface"""
+        # Title
+        title = self._text(self.font_large, "ASTRID MART - LEARNING MODE", ORANGE)
+        title_rect = title.get_rect(center=(self.width//2, self.height * 0.05))
+        surface.blit(title, title_rect)
+        
+        # Instruction
+        find_text = self._text(self.font_large, "SCAN THIS PRODUCT:", PURPLE)
+        find_rect = find_text.get_rect(center=(self.width//2, self.height * 0.25))
+        surface.blit(find_text, find_rect)
         
         # Exit button at bottom - clear and responsive
-        button_width = self.width * 0.25
-        button_height = self.height * 0.06
-        exit_button_y = self.height * 0.95
-        exit_button_rect = pygame.Rect(self.width//2 - button_width//2, exit_button_y, button_width, button_height)
-        pygame.draw.rect(self.screen, RED, exit_button_rect)
-        pygame.draw.rect(self.screen, BLACK, exit_button_rect, 3)
-        
-        exit_text = self.font_small.render("RED BUTTON = EXIT", True, BLACK)
+        exit_button_rect = self._layout.exit_button
+        pygame.draw.rect(surface, RED, exit_button_rect)
+        pygame.draw.rect(surface, BLACK, exit_button_rect, 3)
+        
+        exit_text = self._text(self.font_small, "RED BUTTON = EXIT", BLACK)
         exit_text_rect = exit_text.get_rect(center=exit_button_rect.center)
-        self.screen.blit(exit_text, exit_text_rect)
+        surface.blit(exit_text, exit_text_rect)
     
     def draw_product_manager(self):
         """Draw product manager screen"""
-        self.screen.fill(BLACK)
-        
-        # Title
-        title = self.font_large.render("PRODUCT MANAGER", True, PURPLE)
-        title_rect = title.get_rect(center=(self.width//2, self.height * 0.1))
-        title_bg = pygame.Rect(title_rect.x - 20, title_rect.y - 10, 
-                              title_rect.width + 40, title_rect.height + 20)
-        self.draw_border_box(title_bg, PURPLE, 4)
-        self.screen.blit(title, title_rect)
+        # Title, instructions and CSV example never change
+        self.screen.blit(self._chrome(PRODUCT_MANAGER, self._build_product_manager_chrome), (0, 0))
         
         # Product count
-        count_text = self.font_medium.render(f"Products in database: {len(self.skus)}", True, WHITE)
+        product_count = len(self.skus)
+        if self._count_cache[0] != product_count:
+            surface = self._text(self.font_medium, f"Products in database: {product_count}", WHITE)
+            self._count_cache = (product_count, surface)
+        count_text = self._count_cache[1]
         count_rect = count_text.get_rect(center=(self.width//2, self.height * 0.25))
         self.screen.blit(count_text, count_rect)
         
-        # Instructions
-        instructions = [
-            "E - Export products to CSV file",
-            "I - Import products from CSV file",
-            "ESC - Back to menu"
-        ]
+        # Status message
+        if self.scanned_item:
+            status_text = self._text(self.font_small, self.scanned_item, GREEN)
+            status_rect = status_text.get_rect(center=(self.width//2, self.height * 0.85))
+            self.screen.blit(status_text, status_rect)
+    
+    def _build_product_manager_chrome(self, surface):
+        """Draw the static parts of the product manager screen onto surface"""
+        # Title
+        title = self._text(self.font_large, "PRODUCT MANAGER", PURPLE)
+        self.draw_border_box(self._layout.manager_title_bg, PURPLE, 4, surface)
+        surface.blit(title, self._layout.manager_title)
         
+        # Instructions
         start_y = self.height * 0.4
-        for i, instruction in enumerate(instructions):
-            text = self.font_medium.render(instruction, True, CYAN)
+        for i, instruction in enumerate(MANAGER_INSTRUCTIONS):
+            text = self._text(self.font_medium, instruction, CYAN)
             text_rect = text.get_rect(center=(self.width//2, start_y + i * self.height * 0.08))
-            self.screen.blit(text, text_rect)
+            surface.blit(text, text_rect)
         
         # CSV format example
         example_y = self.height * 0.65
-        example_title = self.font_small.render("CSV Format Example:", True, YELLOW)
-        self.screen.blit(example_title, (self.width * 0.1, example_y))
-        
-        csv_example = [
-            "SKU,Name,Price,Category,Description,Image",
-            "7501234567890,White Bread,2.20,Bakery,Fresh bread,images/bread.png"
-        ]
+        example_title = self._text(self.font_small, "CSV Format Example:", YELLOW)
+        surface.blit(example_title, (self.width * 0.1, example_y))
         
-        for i, line in enumerate(csv_example):
-            text = self.font_small.render(line, True, WHITE)
-            self.screen.blit(text, (self.width * 0.1, example_y + 30 + i * 25))
-        
-        # Status message
-        if self.scanned_item:
-            status_text = self.font_small.render(self.scanned_item, True, GREEN)
-            status_rect = status_text.get_rect(center=(self.width//2, self.height * 0.85))
-            self.screen.blit(status_text, status_rect)
+        for i, line in enumerate(CSV_EXAMPLE_LINES):
+            text = self._text(self.font_small, line, WHITE)
+            surface.blit(text, (self.width * 0.1, example_y + 30 + i * 25))
     
     def draw_game_over(self):
         """Draw game over screen with big blinking score"""
-        self.screen.fill(BLACK)
+        # Title, score label and continue hint never change
+        self.screen.blit(self._chrome(GAME_OVER, self._build_game_over_chrome), (0, 0))
+        
+        # BIG BLINKING SCORE NUMBER
+        score_text, score_rect = self._game_over_score()
+        self._anim_rect = score_rect  # Only the score blinks between frames
         
+        # Total products attempted
+        total_items = self.learning_total
+        if self._out_of_cache[0] != total_items:
+            surface = self._text(self.font_medium, f"out of {total_items} products", CYAN)
+            self._out_of_cache = (total_items, surface)
+        total_text = self._out_of_cache[1]
+        total_rect = total_text.get_rect(center=(self.width//2, self.height * 0.7))
+        
+        self.blit_all([(score_text, score_rect), (total_text, total_rect)])
+    
+    def _build_game_over_chrome(self, surface):
+        """Draw the static parts of the game over screen onto surface"""
         # Title
-        title = self.font_huge.render("LEARNING COMPLETE!", True, BRIGHT_GREEN)
+        title = self._text(self.font_huge, "LEARNING COMPLETE!", BRIGHT_GREEN)
         title_rect = title.get_rect(center=(self.width//2, self.height * 0.2))
-        self.screen.blit(title, title_rect)
+        surface.blit(title, title_rect)
         
         # Your Score text
-        score_label = self.font_large.render("Your Score:", True, WHITE)
+        score_label = self._text(self.font_large, "Your Score:", WHITE)
         score_label_rect = score_label.get_rect(center=(self.width//2, self.height * 0.4))
-        self.screen.blit(score_label, score_label_rect)
-        
-        # BIG BLINKING SCORE NUMBER
-        blink_time = pygame.time.get_ticks()
-        score_color = YELLOW if (blink_time // 500) % 2 == 0 else RED
-        
-        # Make an even bigger font for the score
-        score_font = pygame.font.Font(None, int(self.height * 0.2))  # 20% of screen height
-        score_text = score_font.render(str(self.timer_correct), True, score_color)
-        score_rect = score_text.get_rect(center=(self.width//2, self.height * 0.55))
-        self.screen.blit(score_text, score_rect)
-        
-        # Total products attempted
-        total_items = len(self.learning_product_order) if hasattr(self, 'learning_product_order') else len(self.skus.values())
-        total_text = self.font_medium.render(f"out of {total_items} products", True, CYAN)
-        total_rect = total_text.get_rect(center=(self.width//2, self.height * 0.7))
-        self.screen.blit(total_text, total_rect)
+        surface.blit(score_label, score_label_rect)
         
         # Continue instruction - use RED button which goes back to menu
-        continue_text = self.font_medium.render("Press     button to continue", True, WHITE)
+        continue_text = self._text(self.font_medium, "Press     button to continue", WHITE)
         continue_rect = continue_text.get_rect(center=(self.width//2, self.height * 0.85))
         # Draw red circle (K4 - Exit/Continue action)
         circle_x = continue_rect.centerx - 60
-        pygame.draw.circle(self.screen, RED, (circle_x, continue_rect.centery), 15)
-        pygame.draw.circle(self.screen, BLACK, (circle_x, continue_rect.centery), 15, 2)
-        self.screen.blit(continue_text, continue_rect)
+        pygame.draw.circle(surface, RED, (circle_x, continue_rect.centery), 15)
+        pygame.draw.circle(surface, BLACK, (circle_x, continue_rect.centery), 15, 2)
+        surface.blit(continue_text, continue_rect)
+    
+    def _payment_dots(self):
+        """The processing dots surface and rect for the current time"""
+        dots = "." * ((pygame.time.get_ticks() // 500) % 4)
+        dots_text = self._text(self.font_large, dots, YELLOW)
+        return dots_text, dots_text.get_rect(center=(self.width//2, self.height * 0.5))
+    
+    def _game_over_score(self):
+        """The blinking score surface and rect for the current time"""
+        score_color = SCORE_BLINK_COLORS[(pygame.time.get_ticks() // 500) & 1]
+        score_text = self._text(self.font_score, str(self.timer_correct), score_color)
+        return score_text, score_text.get_rect(center=(self.width//2, self.height * 0.55))
+    
+    def draw_animation_frame(self):
+        """Redraw and upload only the moving part of an animating screen"""
+        self.screen.fill(BLACK, self._anim_rect)
+        if self.state == GAME_OVER:
+            self.screen.blit(*self._game_over_score())
+        else:
+            self.screen.blit(*self._payment_dots())
+        pygame.display.update(self._anim_rect)
+    
+    def is_animating(self):
+        """True for screens that change without input (processing dots, blinking score)"""
+        return self.state == GAME_OVER or (self.state == PAYMENT_MODE and self.payment_step == 1)
     
     def run(self):
         """Main game loop"""
@@ -1606,25 +2039,36 @@ class ArcadeRetailGame:
             # Check for serial scanner input
             self.check_serial_scanner()
             
-            # Check shutdown combo continuously when relevant buttons might be held
-            if self.joystick and (self.joystick.get_button(3) or self.joystick.get_button(4)):
-                self.check_shutdown_combo()
+            # Poll the shutdown combo once per frame; it also resets itself on release
+            self.check_shutdown_combo()
             
-            # Draw based on current state
-            if self.state == MENU:
-                self.draw_menu()
-            elif self.state == RETAIL_MODE:
-                self.draw_retail_mode()
-            elif self.state == PAYMENT_MODE:
-                self.draw_payment_mode()
-            elif self.state == TIMER_MODE:
-                self.draw_timer_mode()
-            elif self.state == GAME_OVER:
-                self.draw_game_over()
-            elif self.state == PRODUCT_MANAGER:
-                self.draw_product_manager()
+            # Only redraw when something changed or the screen is animating
+            if self._dirty:
+                state = self.state
+                
+                # Draw based on current state
+                if self.state == MENU:
+                    self.draw_menu()
+                elif self.state == RETAIL_MODE:
+                    self.draw_retail_mode()
+                elif self.state == PAYMENT_MODE:
+                    self.draw_payment_mode()
+                elif self.state == TIMER_MODE:
+                    self.draw_timer_mode()
+                elif self.state == GAME_OVER:
+                    self.draw_game_over()
+                elif self.state == PRODUCT_MANAGER:
+                    self.draw_product_manager()
+                
+                pygame.display.flip()
+                
+                # Drawing can switch state (learning mode ends itself), which
+                # needs another frame
+                self._dirty = self.state != state
+            elif self.is_animating():
+                # Nothing else changed since the last full draw
+                self.draw_animation_frame()
             
-            pygame.display.flip()
             self.clock.tick(FPS)
         
         # Clean up serial scanner
@@ -1638,11 +2082,14 @@ class ArcadeRetailGame:
         if self.joystick:
             self.joystick.quit()
         
+        # Let any pending receipt finish writing
+        self._receipt_writer.shutdown(wait=True)
+        
         pygame.quit()
 
 if __name__ == "__main__":
     # Check for help argument
-    if '--help' in os.sys.argv or '-h' in os.sys.argv:
+    if '--help' in sys.argv or '-h' in sys.argv:
         print("Arcade Retail Store Game")
         print("Usage: python main.py [options]")
         print("")
@@ -7,6 +7,36 @@ Simple command-line interface to manage SKUs and products
 import json
 import csv
 import os
+import mmap
+try:
+    from orjson import loads as json_loads
+    from orjson import dumps as orjson_dumps, OPT_INDENT_2
+    ORJSON_AVAILABLE = True
+    
+    def json_dumps(data):
+        """Serialize data as indented JSON bytes"""
+        return orjson_dumps(data, option=OPT_INDENT_2)
+except ImportError:
+    from json import loads as json_loads
+    ORJSON_AVAILABLE = False
+    
+    def json_dumps(data):
+        """Serialize data as indented JSON bytes"""
+        return json.dumps(data, indent=2).encode('utf-8')
+
+# Catalogs at least this big are parsed straight from a memory map
+MMAP_MIN_SIZE = 1024 * 1024
+
+# File buffer for CSV import/export, fewer read/write calls on big catalogs
+CSV_BUFFER_SIZE = 1024 * 1024
+
+def scale_prices(prices, multiplier):
+    """Multiply every price and round to cents"""
+    return [round(price * multiplier, 2) for price in prices]
+
+def clamp_prices(prices, min_price, max_price):
+    """Limit every price to [min_price, max_price]"""
+    return [max(min_price, min(max_price, price)) for price in prices]
 
 class ProductManager:
     def __init__(self):
@@ -14,12 +44,42 @@ class ProductManager:
         self.products_data = self.load_products()
         self.skus = self.products_data.get('skus', {})
         self.keyboard_shortcuts = self.products_data.get('keyboard_shortcuts', {})
+        self.index_shortcuts()
+        self._image_exists_cache = {}  # image path -> bool, see image_exists
+        self._catalog_stats = None  # (total value, products with images), see catalog_stats
+    
+    def catalog_stats(self):
+        """Return the total catalog value and how many products have an image on disk"""
+        if self._catalog_stats is None:
+            total_value = sum(product['price'] for product in self.skus.values())
+            with_images = sum(1 for p in self.skus.values() if p.get('image') and self.image_exists(p['image']))
+            self._catalog_stats = (total_value, with_images)
+        return self._catalog_stats
+    
+    def image_exists(self, path):
+        """Check whether an image file exists, remembering the answer per path"""
+        exists = self._image_exists_cache.get(path)
+        if exists is None:
+            exists = self._image_exists_cache[path] = os.path.exists(path)
+        return exists
+    
+    def index_shortcuts(self):
+        """Rebuild the SKU -> shortcut key lookup after keyboard_shortcuts changes"""
+        self.sku_to_shortcut = {}
+        for key, sku in self.keyboard_shortcuts.items():
+            self.sku_to_shortcut.setdefault(sku, key)
     
     def load_products(self):
         """Load products from JSON file"""
         try:
-            with open(self.products_file, 'r') as f:
-                return json.load(f)
+            with open(self.products_file, 'rb') as f:
+                # orjson can parse the mapped pages directly, saving a copy of
+                # a large file; the stdlib parser needs bytes either way
+                if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        with memoryview(mapped) as view:
+                            return json_loads(view)
+                return json_loads(f.read())
         except FileNotFoundError:
             print(f"Products file {self.products_file} not found. Creating new one...")
             return {"skus": {}, "keyboard_shortcuts": {}}
@@ -28,8 +88,12 @@ class ProductManager:
         """Save products to JSON file"""
         self.products_data['skus'] = self.skus
         self.products_data['keyboard_shortcuts'] = self.keyboard_shortcuts
-        with open(self.products_file, 'w') as f:
-            json.dump(self.products_data, f, indent=2)
+        # Write a temp file and swap it in so a crash can't leave a half-written catalog
+        temp_file = self.products_file + '.tmp'
+        with open(temp_file, 'wb') as f:
+            f.write(json_dumps(self.products_data))
+        os.replace(temp_file, self.products_file)
+        self._catalog_stats = None  # Every change goes through here
         print(f"Products saved to {self.products_file}")
     
     def add_product(self):
@@ -64,12 +128,12 @@ class ProductManager:
         # Ask for keyboard shortcut
         shortcut = input("Assign keyboard shortcut (0-9, or press Enter to skip): ").strip()
         if shortcut and shortcut.isdigit() and len(shortcut) == 1:
-            # Remove existing shortcut if any
-            for key, existing_sku in list(self.keyboard_shortcuts.items()):
-                if existing_sku == sku:
-                    del self.keyboard_shortcuts[key]
+            # Remove existing shortcuts if any - the index only keeps one key per SKU
+            for key in [key for key, existing_sku in self.keyboard_shortcuts.items() if existing_sku == sku]:
+                del self.keyboard_shortcuts[key]
             
             self.keyboard_shortcuts[shortcut] = sku
+            self.index_shortcuts()
             print(f"Keyboard shortcut '{shortcut}' assigned to {name}")
         
         print(f"Product '{name}' added successfully!")
@@ -110,6 +174,7 @@ class ProductManager:
         image = input(f"Image path [{product.get('image', '')}]: ").strip()
         if image or image == "":
             product['image'] = image
+            self._image_exists_cache.pop(image, None)
         
         print(f"Product '{product['name']}' updated successfully!")
         self.save_products()
@@ -121,19 +186,18 @@ class ProductManager:
             print("No products found.")
             return
         
-        print(f"{'SKU':<15} {'Name':<20} {'Price':<8} {'Category':<12} {'Shortcut':<8} {'Image':<15}")
-        print("-" * 85)
+        # Collect the whole table and print it in one go
+        lines = [f"{'SKU':<15} {'Name':<20} {'Price':<8} {'Category':<12} {'Shortcut':<8} {'Image':<15}",
+                 "-" * 85]
         
         for sku, product in self.skus.items():
-            shortcut = ""
-            for key, mapped_sku in self.keyboard_shortcuts.items():
-                if mapped_sku == sku:
-                    shortcut = key
-                    break
+            shortcut = self.sku_to_shortcut.get(sku, "")
             
-            image_display = "✓" if product.get('image') and os.path.exists(product.get('image', '')) else "✗"
+            image_display = "✓" if product.get('image') and self.image_exists(product['image']) else "✗"
             
-            print(f"{sku:<15} {product['name']:<20} €{product['price']:<7.2f} {product['category']:<12} {shortcut:<8} {image_display:<15}")
+            lines.append(f"{sku:<15} {product['name']:<20} €{product['price']:<7.2f} {product['category']:<12} {shortcut:<8} {image_display:<15}")
+        
+        print("\n".join(lines))
     
     def delete_product(self):
         """Delete a product"""
@@ -151,10 +215,10 @@ class ProductManager:
             del self.skus[sku]
             
             # Remove keyboard shortcut if exists
-            for key, mapped_sku in list(self.keyboard_shortcuts.items()):
-                if mapped_sku == sku:
-                    del self.keyboard_shortcuts[key]
-                    break
+            key = self.sku_to_shortcut.get(sku)
+            if key is not None:
+                del self.keyboard_shortcuts[key]
+                self.index_shortcuts()
             
             print(f"Product '{product_name}' deleted successfully!")
             self.save_products()
@@ -165,19 +229,17 @@ class ProductManager:
         """Export products to CSV"""
         csv_file = 'products.csv'
         try:
-            with open(csv_file, 'w', newline='') as f:
+            with open(csv_file, 'w', newline='', buffering=CSV_BUFFER_SIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(['SKU', 'Name', 'Price', 'Category', 'Description', 'Image'])
-                
-                for sku, product in self.skus.items():
-                    writer.writerow([
-                        sku,
-                        product['name'],
-                        product['price'],
-                        product['category'],
-                        product.get('description', ''),
-                        product.get('image', '')
-                    ])
+                writer.writerows([
+                    sku,
+                    product['name'],
+                    product['price'],
+                    product['category'],
+                    product.get('description', ''),
+                    product.get('image', '')
+                ] for sku, product in self.skus.items())
             
             print(f"Products exported to {csv_file}")
         except Exception as e:
@@ -192,13 +254,31 @@ class ProductManager:
             return
         
         try:
-            with open(csv_file, 'r') as f:
-                reader = csv.DictReader(f)
+            with open(csv_file, 'r', buffering=CSV_BUFFER_SIZE) as f:
+                # Plain rows indexed by column position; Description and Image are optional
+                reader = csv.reader(f)
+                header = next(reader, [])
+                columns = {name: i for i, name in enumerate(header)}
+                sku_col, name_col, price_col, category_col = (columns[name] for name in ('SKU', 'Name', 'Price', 'Category'))
+                description_col = columns.get('Description')
+                image_col = columns.get('Image')
                 new_count = 0
                 updated_count = 0
+                skipped_count = 0
                 
                 for row in reader:
-                    sku = row['SKU']
+                    # Pad short rows (dropped trailing columns) so every column index
+                    # exists; skip blank lines and rows without a usable price
+                    if len(row) < len(header):
+                        row += [''] * (len(header) - len(row))
+                    sku = row[sku_col]
+                    if not sku.strip():
+                        continue
+                    try:
+                        price = float(row[price_col])
+                    except ValueError:
+                        skipped_count += 1
+                        continue
                     
                     if sku in self.skus:
                         updated_count += 1
@@ -206,16 +286,19 @@ class ProductManager:
                         new_count += 1
                     
                     self.skus[sku] = {
-                        'name': row['Name'],
-                        'price': float(row['Price']),
-                        'category': row['Category'],
-                        'description': row.get('Description', ''),
-                        'image': row.get('Image', '')
+                        'name': row[name_col],
+                        'price': price,
+                        'category': row[category_col],
+                        'description': row[description_col] if description_col is not None else '',
+                        'image': row[image_col] if image_col is not None else ''
                     }
+                    self._image_exists_cache.pop(self.skus[sku]['image'], None)
                 
                 self.save_products()
                 print(f"CSV imported successfully!")
                 print(f"New products: {new_count}, Updated products: {updated_count}")
+                if skipped_count:
+                    print(f"Skipped {skipped_count} rows with an invalid price")
                 
         except Exception as e:
             print(f"Error importing CSV: {e}")
@@ -234,15 +317,8 @@ class ProductManager:
                 print(f"  {key}: (unassigned)")
         
         print("\nAvailable products:")
-        unassigned_products = []
-        for sku, product in self.skus.items():
-            is_assigned = False
-            for mapped_sku in self.keyboard_shortcuts.values():
-                if mapped_sku == sku:
-                    is_assigned = True
-                    break
-            if not is_assigned:
-                unassigned_products.append((sku, product['name']))
+        unassigned_products = [(sku, product['name']) for sku, product in self.skus.items()
+                               if sku not in self.sku_to_shortcut]
         
         if unassigned_products:
             for i, (sku, name) in enumerate(unassigned_products[:10]):
@@ -261,6 +337,7 @@ class ProductManager:
             return
         
         self.keyboard_shortcuts[key] = sku
+        self.index_shortcuts()
         product_name = self.skus[sku]['name']
         print(f"Key '{key}' assigned to '{product_name}'")
         self.save_products()
@@ -272,7 +349,7 @@ class ProductManager:
         
         for sku, product in self.skus.items():
             image_path = product.get('image', '')
-            status = "✓ Found" if image_path and os.path.exists(image_path) else "✗ Missing"
+            status = "✓ Found" if image_path and self.image_exists(image_path) else "✗ Missing"
             print(f"  {product['name']}: {image_path} ({status})")
         
         print("\nOptions:")
@@ -293,12 +370,15 @@ class ProductManager:
             
             new_image = input("Enter new image path (or press Enter to clear): ").strip()
             self.skus[sku]['image'] = new_image
+            self._image_exists_cache.pop(new_image, None)
             self.save_products()
             print("Image path updated!")
         
         elif choice == '2':
             if os.path.exists('create_placeholder_images.py'):
                 os.system('python3 create_placeholder_images.py')
+                self._image_exists_cache.clear()
+                self._catalog_stats = None
             else:
                 print("Placeholder image generator not found!")
         
@@ -350,9 +430,11 @@ class ProductManager:
                 percentage = float(input("Enter percentage change (+10 for 10% increase, -5 for 5% decrease): "))
                 multiplier = 1 + (percentage / 100)
                 
-                for sku, product in self.skus.items():
-                    old_price = product['price']
-                    new_price = round(old_price * multiplier, 2)
+                products = list(self.skus.values())
+                old_prices = [product['price'] for product in products]
+                new_prices = scale_prices(old_prices, multiplier)
+                
+                for product, old_price, new_price in zip(products, old_prices, new_prices):
                     product['price'] = new_price
                     print(f"  {product['name']}: €{old_price:.2f} → €{new_price:.2f}")
                 
@@ -370,9 +452,11 @@ class ProductManager:
                     print("Minimum price must be less than maximum price!")
                     return
                 
-                for sku, product in self.skus.items():
-                    old_price = product['price']
-                    new_price = max(min_price, min(max_price, old_price))
+                products = list(self.skus.values())
+                old_prices = [product['price'] for product in products]
+                new_prices = clamp_prices(old_prices, min_price, max_price)
+                
+                for product, old_price, new_price in zip(products, old_prices, new_prices):
                     if new_price != old_price:
                         product['price'] = new_price
                         print(f"  {product['name']}: €{old_price:.2f} → €{new_price:.2f}")
@@ -396,11 +480,10 @@ class ProductManager:
             print(f"📦 Products in database: {len(self.skus)}")
             
             if self.skus:
-                total_value = sum(product['price'] for product in self.skus.values())
+                total_value, with_images = self.catalog_stats()
                 print(f"💰 Total catalog value: €{total_value:.2f}")
                 
                 # Check image status
-                with_images = sum(1 for p in self.skus.values() if p.get('image') and os.path.exists(p.get('image', '')))
                 print(f"🖼️  Products with images: {with_images}/{len(self.skus)}")
             
             print()
@@ -7,14 +7,7 @@ This script handles basic setup and runs the game
 import sys
 import os
 import subprocess
-
-def check_pygame():
-    """Check if pygame is installed"""
-    try:
-        import pygame
-        return True
-    except ImportError:
-        return False
+import importlib
 
 def install_pygame():
     """Try to install pygame"""
@@ -29,6 +22,19 @@ def install_pygame():
         print("  pip install pygame")
         return False
 
+def import_game():
+    """Import the game class, installing pygame first if it is missing"""
+    try:
+        from main import ArcadeRetailGame
+    except ImportError as e:
+        if e.name != 'pygame':
+            raise
+        if not install_pygame():
+            return None
+        importlib.invalidate_caches()  # Let the import system see the new package
+        from main import ArcadeRetailGame
+    return ArcadeRetailGame
+
 def main():
     """Main launcher function"""
     print("🎮 ARCADE RETAIL STORE GAME LAUNCHER 🛒")
@@ -55,19 +61,16 @@ def main():
         print("   Press F11 in-game to toggle windowed mode")
         print("   Press ESC to quit")
     
-    # Check if pygame is available
-    if not check_pygame():
-        if not install_pygame():
-            input("Press Enter to exit...")
-            return
-    
     # Set environment variable for windowed mode
     if windowed:
         os.environ['ARCADE_WINDOWED'] = '1'
     
-    # Import and run the game
+    # Import and run the game - a missing pygame shows up (and gets installed) here
     try:
-        from main import ArcadeRetailGame
+        ArcadeRetailGame = import_game()
+        if ArcadeRetailGame is None:
+            input("Press Enter to exit...")
+            return
         print("🚀 Starting Arcade Retail Store Game...")
         print("=" * 50)
         game = ArcadeRetailGame()
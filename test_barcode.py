@@ -4,10 +4,15 @@ Test Barcode Scanner - Simple test to verify barcode scanner setup
 Run this to test if your barcode scanner is working correctly with the game
 """
 
-import json
+import sys
+import select
 import threading
 import time
 import queue
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 try:
     import serial
     import serial.tools.list_ports
@@ -16,6 +21,13 @@ except ImportError:
     SERIAL_AVAILABLE = False
     print("pyserial not available - serial barcode scanners won't work")
 
+# Every byte that isn't an ASCII letter or digit
+BARCODE_JUNK = bytes(c for c in range(256) if not bytes((c,)).isalnum())
+
+def clean_barcode(text):
+    """Keep only the letters and digits of a barcode"""
+    return text.encode('ascii', 'ignore').translate(None, BARCODE_JUNK).decode('ascii')
+
 def setup_serial_scanner():
     """Setup serial barcode scanner if available"""
     if not SERIAL_AVAILABLE:
@@ -62,45 +74,61 @@ def read_serial_scanner(scanner, scan_queue, running):
     if not scanner:
         return
     
-    barcode_buffer = ""
+    barcode_buffer = bytearray()  # Grows in place across partial reads
+    read_until = scanner.read_until
     
     while running[0]:
         try:
-            if scanner.in_waiting > 0:
-                # Read available data
-                data = scanner.read(scanner.in_waiting)
-                text = data.decode('utf-8', errors='ignore').strip()
+            # Block until the scanner sends a CR-terminated code (or the port
+            # timeout expires) instead of polling in_waiting. The checks run on
+            # the raw bytes; only complete codes get decoded for the queue.
+            data = read_until(b'\r').strip()
+            
+            if data:
+                print(f"📡 Serial received: '{data.decode('utf-8', errors='replace')}'")
                 
-                if text:
-                    print(f"📡 Serial received: '{text}'")
-                    
-                    # Check if this looks like a complete barcode
-                    if len(text) >= 8 and text.isalnum():
-                        # Put complete barcode in queue
+                # Check if this looks like a complete barcode
+                if len(data) >= 8 and data.isalnum():
+                    # Put complete barcode in queue
+                    text = data.decode('ascii')
+                    scan_queue.put(text)
+                    print(f"✅ Complete barcode detected: '{text}'")
+                else:
+                    # Handle partial data
+                    barcode_buffer += data
+                    if len(barcode_buffer) >= 8 and barcode_buffer.isalnum():
+                        text = barcode_buffer.decode('ascii')
                         scan_queue.put(text)
-                        print(f"✅ Complete barcode detected: '{text}'")
-                    else:
-                        # Handle partial data
-                        barcode_buffer += text
-                        if len(barcode_buffer) >= 8 and barcode_buffer.isalnum():
-                            scan_queue.put(barcode_buffer)
-                            print(f"✅ Buffered barcode complete: '{barcode_buffer}'")
-                            barcode_buffer = ""
-            
-            time.sleep(0.01)  # Small delay to prevent busy waiting
+                        print(f"✅ Buffered barcode complete: '{text}'")
+                        barcode_buffer.clear()
             
         except Exception as e:
             print(f"❌ Serial scanner read error: {e}")
             time.sleep(0.1)
 
+def wait_for_input(scan_queue):
+    """Wait for a line on stdin or a barcode from the serial reader, whichever arrives first"""
+    while True:
+        ready, _, _ = select.select([sys.stdin], [], [], 0.1)
+        if ready:
+            line = sys.stdin.readline()
+            return line.strip() if line else 'quit'  # EOF ends the test
+        
+        try:
+            barcode = scan_queue.get_nowait()
+        except queue.Empty:
+            continue
+        print(f"\n📡 Serial scanner input: {barcode}")
+        return barcode
+
 def main():
     print("🔍 BARCODE SCANNER TEST")
     print("=" * 50)
     
     # Load the products database
     try:
-        with open('products.json', 'r') as f:
-            products_data = json.load(f)
+        with open('products.json', 'rb') as f:
+            products_data = json_loads(f.read())
             skus = products_data.get('skus', {})
     except FileNotFoundError:
         print("❌ Error: products.json not found!")
@@ -128,20 +156,10 @@ def main():
     
     while True:
         try:
-            # Check for serial scanner input
-            barcode_from_scanner = None
             if serial_scanner:
-                try:
-                    while not scan_queue.empty():
-                        barcode_from_scanner = scan_queue.get_nowait()
-                        break
-                except queue.Empty:
-                    pass
-            
-            # If we got a barcode from scanner, process it
-            if barcode_from_scanner:
-                user_input = barcode_from_scanner
-                print(f"📡 Serial scanner input: {user_input}")
+                # Take whichever comes first, a typed line or a scanned code
+                print("\nScan barcode or type 'quit': ", end="", flush=True)
+                user_input = wait_for_input(scan_queue)
             else:
                 # Get manual input
                 user_input = input("\nScan barcode or type 'quit': ").strip()
@@ -154,22 +172,22 @@ def main():
                 continue
             
             # Clean the input (keep only alphanumeric characters)
-            clean_barcode = ''.join(filter(str.isalnum, user_input))
+            barcode = clean_barcode(user_input)
             
-            if clean_barcode in skus:
-                product = skus[clean_barcode]
+            if barcode in skus:
+                product = skus[barcode]
                 print(f"✅ SUCCESS! Found product:")
                 print(f"   📦 {product['name']}")
                 print(f"   💰 €{product['price']:.2f}")
                 print(f"   🏷️  {product['category']}")
-                print(f"   🔍 Barcode: {clean_barcode}")
+                print(f"   🔍 Barcode: {barcode}")
                 print(f"   ✨ This will work perfectly in the game!")
             else:
-                print(f"❌ Barcode not found: {clean_barcode}")
+                print(f"❌ Barcode not found: {barcode}")
                 print(f"   Available barcodes: {', '.join(skus.keys())}")
                 
                 # Check if it's a partial match
-                partial_matches = [sku for sku in skus.keys() if sku.startswith(clean_barcode)]
+                partial_matches = [sku for sku in skus.keys() if sku.startswith(barcode)]
                 if partial_matches:
                     print(f"   📝 Did you mean one of these? {', '.join(partial_matches)}")
         
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Tests for the game's CSV product import
+Run with: python -m unittest discover tests
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# main initializes pygame on import; no window is needed here
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+try:
+    import main
+except ImportError:
+    main = None
+
+HEADER = "SKU,Name,Price,Category,Description,Image\n"
+
+
+@unittest.skipIf(main is None, "pygame not installed")
+class ImportProductsCsvTest(unittest.TestCase):
+    """The in-game import replaces the whole catalog, so it must be all or nothing"""
+
+    def setUp(self):
+        self.old_cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+        # Only the state import_products_csv touches; saving and image loading are mocked
+        self.game = main.ArcadeRetailGame.__new__(main.ArcadeRetailGame)
+        self.original = {'111': {'name': 'Fresh Eggs', 'price': 3.2, 'category': 'Dairy',
+                                 'description': '', 'image': ''}}
+        self.game.skus = self.original
+        self.game.products_data = {'skus': self.original}
+        self.game._text_cache = {}
+        for name in ('_index_products', 'save_products', 'load_product_images'):
+            setattr(self.game, name, mock.Mock())
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        self.tmp.cleanup()
+
+    def write_csv(self, rows):
+        with open('products.csv', 'w', newline='') as f:
+            f.write(HEADER + rows)
+
+    def test_short_rows_and_blank_lines(self):
+        self.write_csv("111,Fresh Eggs,3.20,Dairy\n"    # trailing columns dropped
+                       "   \n"
+                       "\n"
+                       "222,Pasta,2.50,Pantry,Dry,images/pasta.png\n")
+        self.assertTrue(self.game.import_products_csv())
+        self.assertEqual(sorted(self.game.skus), ['111', '222'])
+        self.assertEqual(self.game.skus['111']['image'], '')
+        self.game.save_products.assert_called_once()
+
+    def test_bad_price_keeps_catalog(self):
+        self.write_csv('111,Fresh Eggs,"3,20",Dairy,,\n'
+                       "222,Pasta,2.50,Pantry,,\n")
+        with redirect_stdout(io.StringIO()):
+            self.assertFalse(self.game.import_products_csv())
+        self.assertIs(self.game.skus, self.original)
+        self.game.save_products.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the product tool's price helpers and CSV import
+Run with: python -m unittest discover tests
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import manage_products
+
+
+class PricesTest(unittest.TestCase):
+    """Bulk price changes round to cents like the builtin round()"""
+
+    def test_scale_prices_rounds_like_round(self):
+        self.assertEqual(manage_products.scale_prices([21.5], 0.95), [round(21.5 * 0.95, 2)])
+
+
+class ImportCsvTest(unittest.TestCase):
+    """Ragged or bad rows must not abort the whole import"""
+
+    def setUp(self):
+        self.old_cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        with open('products.csv', 'w', newline='') as f:
+            f.write("SKU,Name,Price,Category,Description,Image\n"
+                    "111,Apple,1.50,Fruit\n"          # trailing columns dropped
+                    "   \n"                           # whitespace-only line
+                    "\n"
+                    "222,Broken,abc,Fruit,,\n"        # unusable price
+                    "333,Cheese,2,Dairy,Mild,cheese.png\n")
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        self.tmp.cleanup()
+
+    def test_short_and_bad_rows(self):
+        with redirect_stdout(io.StringIO()):
+            manager = manage_products.ProductManager()
+            manager.import_csv()
+        self.assertEqual(manager.skus['111'], {'name': 'Apple', 'price': 1.5, 'category': 'Fruit',
+                                               'description': '', 'image': ''})
+        self.assertEqual(manager.skus['333']['image'], 'cheese.png')
+        self.assertEqual(sorted(manager.skus), ['111', '333'])
+
+
+class ShortcutTest(unittest.TestCase):
+    """Giving a product a shortcut replaces every key it had before"""
+
+    def setUp(self):
+        self.old_cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.old_cwd)
+        self.tmp.cleanup()
+
+    def test_add_product_drops_all_old_keys(self):
+        with redirect_stdout(io.StringIO()):
+            manager = manage_products.ProductManager()
+            # Stale keys left over for a SKU that is being (re)added
+            manager.keyboard_shortcuts.update({'1': '999', '2': '999', '3': '555'})
+            manager.index_shortcuts()
+            answers = ['999', 'Milk', '1.20', 'Dairy', '', '', '7']
+            with mock.patch('builtins.input', side_effect=answers):
+                manager.add_product()
+        self.assertEqual(manager.keyboard_shortcuts, {'3': '555', '7': '999'})
+        self.assertEqual(manager.sku_to_shortcut, {'555': '3', '999': '7'})
+
+
+if __name__ == "__main__":
+    unittest.main()